@@ -1,35 +1,64 @@
-from .timeline_manager import TimelineManager
-from .agent_timeline_interface import TimelineAgentInterface
-from .event_schema import TimelineEvent
-from .narrative_stitcher import NarrativeStitcher
-from .voice_memo_ingestion import VoiceMemoIngestor, VoiceMemo
-from .drift_auditor import DriftAuditor
-from .weekly_arc.arc_engine import WeeklyArcEngine
-from .daily_briefing.briefing_engine import DailyBriefingEngine
-from .season_engine.season_engine import SeasonEngine
-from .monthly_arc.monthly_engine import MonthlyArcEngine
-from .book.book_engine import BookEngine
-from .identity.identity_engine import IdentityEngine
-from .hqi_engine import HQIEngine, HQIResult, MemoryEdge, MemoryFabric, MemoryNode
-from .memory_fabric import MemoryFabric, FabricNode, FabricEdge
-from .agents import FabricAgent, BaseAgent
-from .autopilot_types import (
-    DailyRecommendation,
-    WeeklyStrategy,
-    MonthlyCorrection,
-    TransitionGuidance,
-    RiskAlert,
-    MomentumSignal,
-)
-from .insight_engine import InsightEngine
-from .insights_types import (
-    PatternInsight,
-    CorrelationInsight,
-    CyclicBehaviorInsight,
-    IdentityShiftInsight,
-    MotifInsight,
-    PredictionInsight,
-)
+"""LoreKeeper package.
+
+Public names are imported on first access (PEP 562), so importing a single
+submodule or running a CLI such as ``python -m lorekeeper.weekly_arc --help``
+does not load every engine.
+"""
+from importlib import import_module
+from typing import Any
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "TimelineManager": ".timeline_manager",
+    "TimelineAgentInterface": ".agent_timeline_interface",
+    "TimelineEvent": ".event_schema",
+    "NarrativeStitcher": ".narrative_stitcher",
+    "VoiceMemoIngestor": ".voice_memo_ingestion",
+    "VoiceMemo": ".voice_memo_ingestion",
+    "DriftAuditor": ".drift_auditor",
+    "WeeklyArcEngine": ".weekly_arc.arc_engine",
+    "DailyBriefingEngine": ".daily_briefing.briefing_engine",
+    "SeasonEngine": ".season_engine.season_engine",
+    "MonthlyArcEngine": ".monthly_arc.monthly_engine",
+    "BookEngine": ".book.book_engine",
+    "IdentityEngine": ".identity.identity_engine",
+    "HQIEngine": ".hqi_engine",
+    "HQIResult": ".hqi_engine",
+    "MemoryEdge": ".hqi_engine",
+    "MemoryNode": ".hqi_engine",
+    "MemoryFabric": ".memory_fabric",
+    "FabricNode": ".memory_fabric",
+    "FabricEdge": ".memory_fabric",
+    "FabricAgent": ".agents",
+    "BaseAgent": ".agents",
+    "DailyRecommendation": ".autopilot_types",
+    "WeeklyStrategy": ".autopilot_types",
+    "MonthlyCorrection": ".autopilot_types",
+    "TransitionGuidance": ".autopilot_types",
+    "RiskAlert": ".autopilot_types",
+    "MomentumSignal": ".autopilot_types",
+    "InsightEngine": ".insight_engine",
+    "PatternInsight": ".insights_types",
+    "CorrelationInsight": ".insights_types",
+    "CyclicBehaviorInsight": ".insights_types",
+    "IdentityShiftInsight": ".insights_types",
+    "MotifInsight": ".insights_types",
+    "PredictionInsight": ".insights_types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "TimelineManager",
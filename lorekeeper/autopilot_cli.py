@@ -4,6 +4,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from dataclasses import asdict
 from typing import Any, Dict
 
 from .autopilot_engine import AutopilotEngine
@@ -32,8 +33,8 @@ def _load_payload(args: argparse.Namespace) -> Dict[str, Any]:
 
     return {
         "timeline": [
-            TimelineEvent(date="2024-05-01", title="Deep work block", tags=["focus", "build"], metadata={"hour": 9}).__dict__,
-            TimelineEvent(date="2024-05-08", title="Skill practice", tags=["practice", "skill"], metadata={"hour": 9}).__dict__,
+            asdict(TimelineEvent(date="2024-05-01", title="Deep work block", tags=["focus", "build"], metadata={"hour": 9})),
+            asdict(TimelineEvent(date="2024-05-08", title="Skill practice", tags=["practice", "skill"], metadata={"hour": 9})),
         ],
         "tasks": [
             {"title": "Ship autopilot draft", "priority": 7, "due_date": "2024-05-02", "status": "incomplete", "category": "build"},
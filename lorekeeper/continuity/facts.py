@@ -104,7 +104,7 @@ def extract_facts_from_events(events: Iterable[TimelineEvent]) -> List[Canonical
             kind=event.type or "event",
             reference=event.id,
             confidence=float(meta.get("confidence", 1.0)),
-            metadata={"date": event.date, "title": event.title, "tags": event.tags},
+            metadata={"date": event.date, "title": event.title, "tags": list(event.tags)},
         )
 
         facts.append(
@@ -116,7 +116,7 @@ def extract_facts_from_events(events: Iterable[TimelineEvent]) -> List[Canonical
                 sources=[source],
                 scope=scope,
                 permanent=bool(meta.get("permanent", False)),
-                tags=event.tags,
+                tags=list(event.tags),
             )
         )
 
@@ -130,7 +130,7 @@ def extract_facts_from_events(events: Iterable[TimelineEvent]) -> List[Canonical
                 scope="rule",
                 permanent=True,
                 sources=[source],
-                tags=event.tags,
+                tags=list(event.tags),
             )
             facts.append(rule_fact)
     return facts
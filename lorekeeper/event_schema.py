@@ -1,10 +1,11 @@
 """Schema definitions for LoreKeeper timeline events."""
 from dataclasses import dataclass, field
+import sys
 import uuid
-from typing import List, Dict, Any
+from typing import Tuple, Dict, Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimelineEvent:
     """Immutable, atomic representation of a single timeline entry."""
 
@@ -13,7 +14,16 @@ class TimelineEvent:
     title: str = ""
     type: str = ""
     details: str = ""
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = field(default_factory=tuple)
     source: str = ""
     archived: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Tags, types, and sources repeat across thousands of events; interning
+        # shares one string object per value and the tuple keeps tags immutable.
+        # Type and source stay optional, so missing values are left as-is; missing
+        # tags become an empty tuple so callers can always iterate them.
+        object.__setattr__(self, "type", sys.intern(self.type) if self.type else self.type)
+        object.__setattr__(self, "source", sys.intern(self.source) if self.source else self.source)
+        object.__setattr__(self, "tags", tuple(sys.intern(tag) for tag in self.tags) if self.tags else ())
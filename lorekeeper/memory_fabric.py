@@ -2,10 +2,29 @@ from __future__ import annotations
 
 """Memory Fabric: unified graph + vector lattice for Lore Keeper."""
 
-from collections import defaultdict
+from collections import defaultdict, deque
+import heapq
 import math
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from operator import itemgetter, mul
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+def _dot2(a: Sequence[float], b: Sequence[float]) -> float:
+    return a[0] * b[0] + a[1] * b[1]
+
+
+def _dot3(a: Sequence[float], b: Sequence[float]) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _dot4(a: Sequence[float], b: Sequence[float]) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3]
+
+
+# Straight-line dot products for the small widths that dominate the fabric; they
+# sum in the same order as ``sum(map(mul, ...))``, which handles every other width.
+_DOT_KERNELS: Dict[int, Callable[[Sequence[float], Sequence[float]], float]] = {2: _dot2, 3: _dot3, 4: _dot4}
 
 
 @dataclass
@@ -36,6 +55,14 @@ class MemoryFabric:
         self.nodes: Dict[str, FabricNode] = {}
         self.edges: defaultdict[str, List[FabricEdge]] = defaultdict(list)
         self.index_by_type: defaultdict[str, List[str]] = defaultdict(list)
+        # Edges bucketed by (source, edge_type) so typed relationship lookups skip filtering.
+        self._edges_by_type: defaultdict[Tuple[str, str], List[FabricEdge]] = defaultdict(list)
+        # Dense integer positions let traversals track visits in a bytearray.
+        self._id_to_idx: Dict[str, int] = {}
+        self._idx_to_id: List[str] = []
+        # Row-aligned with _idx_to_id so similarity scans skip per-call norm work.
+        self._vectors: List[Tuple[float, ...]] = []
+        self._norms: List[float] = []
 
     # -------- Node Management --------
     def add_node(self, node: FabricNode) -> None:
@@ -43,6 +70,11 @@ class MemoryFabric:
             raise ValueError(f"Node with id {node.id} already exists")
         self.nodes[node.id] = node
         self.index_by_type[node.type].append(node.id)
+        self._id_to_idx[node.id] = len(self._idx_to_id)
+        self._idx_to_id.append(node.id)
+        vector = tuple(node.embedding)
+        self._vectors.append(vector)
+        self._norms.append(math.sqrt(sum(map(mul, vector, vector))))
 
     def get_node(self, node_id: str) -> Optional[FabricNode]:
         return self.nodes.get(node_id)
@@ -53,12 +85,17 @@ class MemoryFabric:
             raise ValueError(f"Source node {source} not found")
         if target not in self.nodes:
             raise ValueError(f"Target node {target} not found")
-        edge = FabricEdge(source, target, weight, edge_type)
-        self.edges[source].append(edge)
+        self._append_edge(FabricEdge(source, target, weight, edge_type))
+
+    def _append_edge(self, edge: FabricEdge) -> None:
+        self.edges[edge.source].append(edge)
+        self._edges_by_type[(edge.source, edge.edge_type)].append(edge)
 
     def get_edges(self, source: Optional[str] = None, edge_type: Optional[str] = None) -> List[FabricEdge]:
         if source is None:
             all_edges = [edge for edges in self.edges.values() for edge in edges]
+        elif edge_type:
+            return list(self._edges_by_type.get((source, edge_type), []))
         else:
             all_edges = list(self.edges.get(source, []))
         if edge_type:
@@ -76,12 +113,20 @@ class MemoryFabric:
         return dot_product / (a_norm * b_norm)
 
     def nearest_neighbors(self, embedding: Sequence[float], k: int = 10) -> List[Tuple[float, str]]:
+        query = tuple(embedding)
+        dim = len(query)
+        query_norm = math.sqrt(sum(map(mul, query, query)))
+        kernel = _DOT_KERNELS.get(dim)
         items: List[Tuple[float, str]] = []
-        for node in self.nodes.values():
-            sim = self._cosine_similarity(node.embedding, embedding)
-            items.append((sim, node.id))
-        items.sort(key=lambda item: item[0], reverse=True)
-        return items[:k]
+        for node_id, vector, norm in zip(self._idx_to_id, self._vectors, self._norms):
+            if norm == 0 or query_norm == 0:
+                sim = 0.0
+            elif kernel is not None and len(vector) == dim:
+                sim = kernel(vector, query) / (norm * query_norm)
+            else:
+                sim = sum(map(mul, vector, query)) / (norm * query_norm)
+            items.append((sim, node_id))
+        return heapq.nlargest(k, items, key=itemgetter(0))
 
     def build_semantic_edges(self, k: int = 5, min_weight: float = 0.0) -> None:
         """Create semantic edges between similar nodes based on cosine similarity."""
@@ -95,51 +140,64 @@ class MemoryFabric:
 
     # -------- Graph Traversal --------
     def bfs(self, start_id: str, depth: int = 3) -> List[str]:
-        visited: Set[str] = set()
-        queue: List[Tuple[str, int]] = [(start_id, 0)]
+        start_idx = self._id_to_idx.get(start_id)
+        if start_idx is None or depth < 0:
+            return [start_id] if depth >= 0 else []
+
+        id_to_idx = self._id_to_idx
+        idx_to_id = self._idx_to_id
+        visited = bytearray(len(idx_to_id))
+        visited[start_idx] = 1
+        queue: deque[Tuple[int, int]] = deque([(start_idx, 0)])
         out: List[str] = []
 
         while queue:
-            nid, d = queue.pop(0)
-            if d > depth:
-                break
-            if nid in visited:
-                continue
-            visited.add(nid)
+            idx, d = queue.popleft()
+            nid = idx_to_id[idx]
             out.append(nid)
-
+            if d == depth:
+                continue
             for edge in self.edges.get(nid, []):
-                queue.append((edge.target, d + 1))
+                target_idx = id_to_idx[edge.target]
+                if not visited[target_idx]:
+                    visited[target_idx] = 1
+                    queue.append((target_idx, d + 1))
 
         return out
 
     def detect_cycles(self) -> bool:
-        visited: Set[str] = set()
-        stack: Set[str] = set()
-
-        def _visit(node_id: str) -> bool:
-            visited.add(node_id)
-            stack.add(node_id)
-            for edge in self.edges.get(node_id, []):
-                if edge.target not in visited:
-                    if _visit(edge.target):
+        # Iterative three-colour DFS (0=white, 1=grey, 2=black) so deep graphs
+        # never hit the recursion limit; a grey target is a back edge.
+        id_to_idx = self._id_to_idx
+        idx_to_id = self._idx_to_id
+        color = bytearray(len(idx_to_id))
+
+        for root in range(len(idx_to_id)):
+            if color[root]:
+                continue
+            color[root] = 1
+            stack: List[Tuple[int, Iterator[FabricEdge]]] = [(root, iter(self.edges.get(idx_to_id[root], [])))]
+            while stack:
+                idx, pending = stack[-1]
+                for edge in pending:
+                    target = id_to_idx[edge.target]
+                    if color[target] == 1:
                         return True
-                elif edge.target in stack:
-                    return True
-            stack.remove(node_id)
-            return False
-
-        for node_id in self.nodes:
-            if node_id not in visited:
-                if _visit(node_id):
-                    return True
+                    if color[target] == 0:
+                        color[target] = 1
+                        stack.append((target, iter(self.edges.get(edge.target, []))))
+                        break
+                else:
+                    color[idx] = 2
+                    stack.pop()
         return False
 
     # -------- Relationships --------
     def neighbors(self, node_id: str, edge_type: Optional[str] = None) -> List[str]:
-        edges = self.edges.get(node_id, [])
         if edge_type:
-            edges = [edge for edge in edges if edge.edge_type == edge_type]
+            edges = self._edges_by_type.get((node_id, edge_type), [])
+        else:
+            edges = self.edges.get(node_id, [])
         return [edge.target for edge in edges]
 
     def narrative_events(self, arc_id: str) -> List[str]:
@@ -202,5 +260,5 @@ class MemoryFabric:
                     continue
                 edge = FabricEdge(node.id, nid, sim, "semantic")
                 inferred.append(edge)
-                self.edges[node.id].append(edge)
+                self._append_edge(edge)
         return inferred
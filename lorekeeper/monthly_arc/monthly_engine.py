@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from datetime import UTC, date, datetime, timedelta
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -360,7 +361,7 @@ class MonthlyArcEngine:
 
     def _serialize(self, obj: Any) -> Any:
         if isinstance(obj, TimelineEvent):
-            return obj.__dict__
+            return asdict(obj)
         return str(obj)
 
 
@@ -34,18 +34,15 @@ class SeasonEngine:
             return datetime.fromisoformat(value).date()
         raise TypeError("Date values must be ISO strings or datetime.date instances")
 
-    def _serialize(self, obj: Any) -> Any:
+    def _json_default(self, obj: Any) -> Any:
+        # json.dumps already walks lists and dicts; only leaf objects it cannot encode land here.
         if is_dataclass(obj):
             return asdict(obj)
-        if hasattr(obj, "__dict__"):
-            return obj.__dict__
-        if isinstance(obj, list):
-            return [self._serialize(item) for item in obj]
-        if isinstance(obj, dict):
-            return {key: self._serialize(value) for key, value in obj.items()}
         if isinstance(obj, (date, datetime)):
             return obj.isoformat()
-        return obj
+        if hasattr(obj, "__dict__"):
+            return obj.__dict__
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
     def _month_labels(self, start: date, end: date) -> List[str]:
         labels: List[str] = []
@@ -101,8 +98,7 @@ class SeasonEngine:
                 normalized = tag.lower()
                 if normalized in {"robotics", "omega1", "japanese", "bjj", "career", "finances"}:
                     epic_counts[normalized] += 1
-            month_label = event.date[:7]
-            events_by_month[month_label].append(event)
+            events_by_month[event.date[:7]].append(event)
 
         for label in months:
             month_events = events_by_month.get(label, [])
@@ -310,8 +306,7 @@ class SeasonEngine:
         if template == "compressed":
             return compressed_md_template(season)
         if template == "json":
-            serializable = json.loads(json.dumps(season, default=self._serialize))
-            return json.dumps(serializable, indent=2, ensure_ascii=False)
+            return json.dumps(season, default=self._json_default, indent=2, ensure_ascii=False)
         if template == "html":
             markdown = default_md_template(season)
             return f"<html><body><pre>{markdown}</pre></body></html>"
@@ -2,19 +2,44 @@
 from __future__ import annotations
 
 import json
+import logging
+import mmap
+import os
+import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-SAFE_EXTENSIONS = {".json"}
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
+# orjson silently reads integers wider than 64 bits as floats, so any input
+# holding a run of 19+ digits goes to the stdlib parser, which keeps them exact.
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
 
-def secure_load_json(path: str | Path, base_dir: Path | None = None) -> Any:
-    """Load JSON from a constrained, safe path.
 
-    Ensures the path stays within the allowed base directory and only
-    whitelisted extensions are read to prevent arbitrary filesystem access.
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, preferring orjson but matching stdlib ``json`` results.
+
+    Records written by the stdlib fallback may hold ``NaN``/``Infinity`` (which
+    orjson rejects) or oversized integers; both are decoded by ``json`` instead.
     """
 
+    if orjson is not None and _LONG_DIGIT_RUN.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+logger = logging.getLogger(__name__)
+
+SAFE_EXTENSIONS = {".json"}
+SAFE_LOG_EXTENSIONS = {".jsonl"}
+
+
+def _resolve_safe_path(path: str | Path, base_dir: Path | None, allowed_extensions: set[str]) -> Path:
     target_path = Path(path).resolve()
     allowed_base = (base_dir or Path(__file__).resolve().parent / "timeline").resolve()
 
@@ -23,11 +48,51 @@ def secure_load_json(path: str | Path, base_dir: Path | None = None) -> Any:
     except ValueError as exc:  # pragma: no cover - guard clause
         raise ValueError("Attempted access outside of allowed timeline directory") from exc
 
-    if target_path.suffix.lower() not in SAFE_EXTENSIONS:
+    if target_path.suffix.lower() not in allowed_extensions:
         raise ValueError("Unsupported file type; only JSON is allowed")
+    return target_path
+
+
+def secure_load_json(path: str | Path, base_dir: Path | None = None) -> Any:
+    """Load JSON from a constrained, safe path.
+
+    Ensures the path stays within the allowed base directory and only
+    whitelisted extensions are read to prevent arbitrary filesystem access.
+    """
+
+    target_path = _resolve_safe_path(path, base_dir, SAFE_EXTENSIONS)
 
     if not target_path.exists():
         target_path.parent.mkdir(parents=True, exist_ok=True)
         target_path.write_text("[]", encoding="utf-8")
 
-    return json.loads(target_path.read_text(encoding="utf-8"))
+    return _json_loads(target_path.read_bytes())
+
+
+def secure_iter_jsonl(path: str | Path, base_dir: Path | None = None) -> Iterator[Any]:
+    """Yield records from a newline-delimited JSON log under the same path rules.
+
+    Missing logs yield nothing; blank lines are skipped. A final line without a
+    trailing newline that fails to parse is the remains of an interrupted append
+    and is skipped with a warning. The log is memory-mapped so lines are parsed
+    straight from the page cache without buffering a copy.
+    """
+
+    target_path = _resolve_safe_path(path, base_dir, SAFE_LOG_EXTENSIONS)
+    if not target_path.exists():
+        return
+    with target_path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return  # mmap rejects empty files
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                if not line.strip():
+                    continue
+                try:
+                    record = _json_loads(line)
+                except ValueError:
+                    if line.endswith(b"\n"):
+                        raise
+                    logger.warning("Skipping truncated trailing record in %s", target_path)
+                    return
+                yield record
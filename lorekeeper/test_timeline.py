@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import json
+import math
+from contextlib import contextmanager
 from datetime import datetime, timedelta, date
 from pathlib import Path
 from tempfile import TemporaryDirectory
 import unittest
+from unittest import mock
 
 from .agent_timeline_interface import TimelineAgentInterface
 from .event_schema import TimelineEvent
@@ -13,17 +16,36 @@ from .timeline_manager import TimelineManager
 from .narrative_stitcher import NarrativeStitcher
 from .voice_memo_ingestion import VoiceMemoIngestor, VoiceMemo
 from .drift_auditor import DriftAuditor
+from .timeline_compaction import compact_outdated_shards, compact_year
+
+_JSON_BACKENDS = ("orjson", "stdlib")
+
+
+@contextmanager
+def _json_backend(name: str):
+    """Run with orjson (when installed) or force the stdlib ``json`` fallback."""
+
+    if name == "orjson":
+        yield
+        return
+    with mock.patch("lorekeeper.timeline_manager.orjson", None), mock.patch("lorekeeper.security.orjson", None):
+        yield
 
 
 class TimelineManagerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
     def setUp(self) -> None:
-        self.temp_dir = TemporaryDirectory()
-        self.base_path = Path(self.temp_dir.name)
+        # One directory per class; each test still gets an isolated shard folder.
+        self.base_path = Path(self.temp_dir.name) / self._testMethodName
         self.manager = TimelineManager(base_path=self.base_path)
 
-    def tearDown(self) -> None:
-        self.temp_dir.cleanup()
-
     def test_add_and_load_event(self) -> None:
         event = TimelineEvent(
             date="2025-02-14",
@@ -38,19 +60,71 @@ class TimelineManagerTests(unittest.TestCase):
         self.assertEqual(len(events), 1)
         self.assertEqual(events[0].title, event.title)
 
+    def test_events_without_source_type_or_tags(self) -> None:
+        event = TimelineEvent(date="2024-03-03", title="Bare", type=None, details="no extras", tags=None, source=None)
+        self.assertIsNone(event.source)
+        self.assertIsNone(event.type)
+        self.assertEqual(event.tags, ())
+        self.manager.add_event(event)
+        reloaded = TimelineManager(base_path=self.base_path).get_events(year=2024)
+        self.assertEqual([(e.title, e.type, e.source, e.tags) for e in reloaded], [("Bare", None, None, ())])
+
+    def test_get_event_reads_the_row_index(self) -> None:
+        stored = self.manager.add_event(TimelineEvent(date="2024-02-02", title="Lookup", type="note", details="by id"))
+        self.assertIs(self.manager.get_event(stored.id), stored)
+        self.assertIsNone(self.manager.get_event("missing-id"))
+
     def test_filter_by_tag_and_date(self) -> None:
         events = [
             TimelineEvent(date="2024-01-01", title="New Year", type="milestone", details="NY Day", tags=["holiday"]),
             TimelineEvent(date="2024-06-10", title="Tournament", type="martial_arts", details="BJJ comp", tags=["bjj"]),
             TimelineEvent(date="2024-12-25", title="Christmas", type="holiday", details="Xmas", tags=["holiday"]),
         ]
-        for event in events:
-            self.manager.add_event(event)
+        self.manager.add_events(events)
 
         filtered = self.manager.get_events(start_date="2024-06-01", end_date="2024-12-31", tags=["holiday"])
         self.assertEqual(len(filtered), 1)
         self.assertEqual(filtered[0].title, "Christmas")
 
+    def test_year_and_date_range_filters_combine(self) -> None:
+        self.manager.add_events(
+            [
+                TimelineEvent(date="2023-12-30", title="Before", type="note", details="prior year"),
+                TimelineEvent(date="2024-03-15", title="Spring", type="note", details="in range"),
+                TimelineEvent(date="2024-01-02", title="January", type="note", details="in range"),
+                TimelineEvent(date="2024-09-01", title="Autumn", type="note", details="after range"),
+            ]
+        )
+        titles = [event.title for event in self.manager.get_events(year=2024, start_date="2023-12-01", end_date="2024-06-30")]
+        self.assertEqual(titles, ["January", "Spring"])
+        self.assertEqual([event.title for event in self.manager.get_events(start_date="2024-09-01")], ["Autumn"])
+
+    def test_multiple_tags_match_any_tag_once(self) -> None:
+        self.manager.add_events(
+            [
+                TimelineEvent(date="2024-07-01", title="Both", type="note", details="a", tags=["bjj", "travel"]),
+                TimelineEvent(date="2024-03-01", title="Travel", type="note", details="b", tags=["travel"]),
+                TimelineEvent(date="2024-05-01", title="Other", type="note", details="c", tags=["work"]),
+                TimelineEvent(date="2024-01-01", title="Grappling", type="note", details="d", tags=["bjj"]),
+            ]
+        )
+        titles = [event.title for event in self.manager.get_events(tags=["bjj", "travel"])]
+        self.assertEqual(titles, ["Grappling", "Travel", "Both"])
+        titles = [event.title for event in self.manager.get_events(start_date="2024-02-01", tags=["bjj", "travel"])]
+        self.assertEqual(titles, ["Travel", "Both"])
+
+    def test_out_of_order_adds_merge_into_sorted_results(self) -> None:
+        self.manager.add_event(TimelineEvent(date="2024-05-01", title="May", type="note", details="first"))
+        self.assertEqual([event.title for event in self.manager.get_events()], ["May"])
+        self.manager.add_events(
+            [
+                TimelineEvent(date="2024-08-01", title="August", type="note", details="later"),
+                TimelineEvent(date="2024-02-01", title="February", type="note", details="earlier"),
+            ]
+        )
+        self.assertEqual([event.title for event in self.manager.get_events()], ["February", "May", "August"])
+        self.assertEqual([event.title for event in self.manager.get_events(year=2024)], ["February", "May", "August"])
+
     def test_archive_and_correction(self) -> None:
         event = TimelineEvent(date="2025-03-01", title="Old Detail", type="note", details="Wrong info")
         stored = self.manager.add_event(event)
@@ -69,6 +143,91 @@ class TimelineManagerTests(unittest.TestCase):
         originals = [e for e in archived_original if e.title == "Old Detail"]
         self.assertTrue(originals[0].archived)
 
+    def test_archived_events_drop_out_of_range_and_period_queries(self) -> None:
+        first = self.manager.add_event(TimelineEvent(date="2025-02-05", title="First", type="note", details="a"))
+        self.manager.add_event(TimelineEvent(date="2025-02-05", title="Second", type="note", details="b"))
+        reference = date(2025, 2, 7)
+        self.assertEqual(len(self.manager.get_events_by_period("last_7_days", reference_date=reference)), 2)
+        self.manager.archive_event(first.id)
+        for events in (
+            self.manager.get_events(),
+            self.manager.get_events(year=2025, start_date="2025-02-01"),
+            self.manager.get_events_by_period("last_7_days", reference_date=reference),
+        ):
+            self.assertEqual([event.title for event in events], ["Second"])
+        self.assertEqual(len(self.manager.get_events(year=2025, include_archived=True)), 2)
+        self.assertIsNone(self.manager.archive_event("missing-id"))
+
+    def test_shards_are_append_only_logs_replayed_on_reload(self) -> None:
+        kept = self.manager.add_event(TimelineEvent(date="2024-04-01", title="Kept", type="note", details="stays"))
+        dropped = self.manager.add_event(TimelineEvent(date="2024-04-02", title="Dropped", type="note", details="goes"))
+        self.manager.archive_event(dropped.id)
+        lines = (self.base_path / "2024.jsonl").read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[-1]), {"id": dropped.id, "archived": True})
+
+        reloaded = TimelineManager(base_path=self.base_path)
+        self.assertEqual([event.id for event in reloaded.get_events()], [kept.id])
+        archived = [event for event in reloaded.get_events(include_archived=True) if event.id == dropped.id]
+        self.assertTrue(archived[0].archived)
+
+    def test_truncated_trailing_record_is_skipped_on_load(self) -> None:
+        kept = self.manager.add_event(TimelineEvent(date="2024-04-01", title="Kept", type="note", details="stays"))
+        with (self.base_path / "2024.jsonl").open("ab") as handle:
+            handle.write(b'{"id": "torn", "date": "2024-04-0')
+
+        with self.assertLogs("lorekeeper.security", level="WARNING"):
+            reloaded = TimelineManager(base_path=self.base_path)
+        self.assertEqual([event.id for event in reloaded.get_events()], [kept.id])
+
+        # The next append cuts the torn line off so later records stay readable.
+        later = reloaded.add_event(TimelineEvent(date="2024-04-03", title="Later", type="note", details="after"))
+        self.assertNotIn(b"torn", (self.base_path / "2024.jsonl").read_bytes())
+        replayed = TimelineManager(base_path=self.base_path)
+        self.assertEqual([event.id for event in replayed.get_events()], [kept.id, later.id])
+
+    def test_legacy_json_shards_still_load(self) -> None:
+        legacy = [{"id": "legacy-1", "date": "2022-07-04", "title": "Legacy", "type": "note", "details": "array shard"}]
+        (self.base_path / "2022.json").write_text(json.dumps(legacy), encoding="utf-8")
+        reloaded = TimelineManager(base_path=self.base_path)
+        self.assertEqual([event.title for event in reloaded.get_events(year=2022)], ["Legacy"])
+
+    def test_nan_and_wide_ints_round_trip_on_both_json_backends(self) -> None:
+        for writer in _JSON_BACKENDS:
+            base_path = self.base_path / writer
+            base_path.mkdir(parents=True)
+            legacy = [
+                {
+                    "id": "legacy-nan",
+                    "date": "2023-03-01",
+                    "title": "Legacy",
+                    "type": "note",
+                    "details": "nan",
+                    "metadata": {"score": math.nan},
+                }
+            ]
+            (base_path / "2023.json").write_text(json.dumps(legacy), encoding="utf-8")
+            with _json_backend(writer):
+                TimelineManager(base_path=base_path).add_event(
+                    TimelineEvent(
+                        date="2023-03-02",
+                        title="Wide",
+                        type="note",
+                        details="numbers",
+                        metadata={"big": 2**70, "ratio": math.nan, "limit": math.inf},
+                    )
+                )
+            for reader in _JSON_BACKENDS:
+                with self.subTest(writer=writer, reader=reader), _json_backend(reader):
+                    reloaded = TimelineManager(base_path=base_path)
+                    events = {event.title: event for event in reloaded.get_events(year=2023)}
+                    self.assertTrue(math.isnan(events["Legacy"].metadata["score"]))
+                    wide = events["Wide"].metadata
+                    self.assertEqual(wide["big"], 2**70)
+                    self.assertIsInstance(wide["big"], int)
+                    self.assertTrue(math.isnan(wide["ratio"]))
+                    self.assertEqual(wide["limit"], math.inf)
+
     def test_agent_interface_add_and_verify(self) -> None:
         agent = TimelineAgentInterface(base_path=self.base_path, max_context_events=5)
         agent.add_event_from_text("Rolled with team", date="2024-05-01", tags=["bjj"], event_type="training")
@@ -99,8 +258,7 @@ class TimelineManagerTests(unittest.TestCase):
             TimelineEvent(date="2025-02-02", title="Earlier", type="note", details="recent"),
             TimelineEvent(date="2024-12-31", title="Last Year", type="note", details="old"),
         ]
-        for event in recent_events:
-            agent.manager.add_event(event)
+        agent.manager.add_events(recent_events)
 
         last_week = agent.manager.get_events_by_period("last_7_days", reference_date=reference)
         self.assertEqual(len(last_week), 2)
@@ -109,6 +267,56 @@ class TimelineManagerTests(unittest.TestCase):
         this_year = agent.manager.get_events_by_period("this_year", reference_date=reference)
         self.assertEqual(len(this_year), 2)
 
+    def test_period_cache_is_bounded_lru(self) -> None:
+        with mock.patch.dict("os.environ", {"LOREKEEPER_PERIOD_CACHE_SIZE": "2"}):
+            manager = TimelineManager(base_path=self.base_path)
+        manager.add_event(TimelineEvent(date="2025-02-07", title="Today", type="note", details="current"))
+        reference = date(2025, 2, 7)
+        manager.get_events_by_period("last_7_days", reference_date=reference)
+        manager.get_events_by_period("last_30_days", reference_date=reference)
+        manager.get_events_by_period("last_7_days", reference_date=reference)
+        manager.get_events_by_period("this_year", reference_date=reference)
+        self.assertEqual(
+            [key[0] for key in manager._period_cache],
+            ["last_7_days", "this_year"],
+        )
+        manager.add_event(TimelineEvent(date="2025-02-06", title="Yesterday", type="note", details="new"))
+        self.assertEqual(len(manager.get_events_by_period("last_7_days", reference_date=reference)), 2)
+
+    def test_rolling_windows_match_plain_range_queries(self) -> None:
+        start = date(2025, 1, 1)
+        self.manager.add_events(
+            [
+                TimelineEvent(date=(start + timedelta(days=offset)).isoformat(), title=f"Day {offset}", type="note", details="log")
+                for offset in range(0, 60, 2)
+            ]
+        )
+        for offset in range(30, 45):
+            reference = start + timedelta(days=offset)
+            for period in ("last_7_days", "last_30_days"):
+                first, last = self.manager._resolve_period_range(period, reference_date=reference)
+                expected = self.manager.get_events(start_date=first, end_date=last)
+                self.assertEqual(self.manager.get_events_by_period(period, reference_date=reference), expected)
+
+    def test_cached_windows_pick_up_adds_and_archives(self) -> None:
+        reference = date(2025, 2, 7)
+        kept = self.manager.add_event(TimelineEvent(date="2025-02-03", title="Kept", type="note", details="a"))
+        for period in ("last_7_days", "last_30_days"):
+            self.manager.get_events_by_period(period, reference_date=reference)
+            self.manager.get_events_by_period(period, reference_date=reference, include_archived=True)
+        self.manager.add_events(
+            [
+                TimelineEvent(date="2025-02-05", title="Later", type="note", details="b"),
+                TimelineEvent(date="2025-02-01", title="Earlier", type="note", details="c"),
+                TimelineEvent(date="2024-06-01", title="Outside", type="note", details="d"),
+            ]
+        )
+        self.manager.archive_event(kept.id)
+        last_week = self.manager.get_events_by_period("last_7_days", reference_date=reference)
+        self.assertEqual([event.title for event in last_week], ["Earlier", "Later"])
+        last_month = self.manager.get_events_by_period("last_30_days", reference_date=reference, include_archived=True)
+        self.assertEqual([event.title for event in last_month], ["Earlier", "Kept", "Later"])
+
     def test_narrative_stitcher(self) -> None:
         events = [
             TimelineEvent(date="2025-01-01", title="Kickoff", type="project", details="Start", tags=["robotics"]),
@@ -134,6 +342,39 @@ class TimelineManagerTests(unittest.TestCase):
         self.assertEqual(len(stored), 1)
         self.assertEqual(stored[0].metadata["device"], "iphone")
 
+    def test_add_events_batches_and_deduplicates(self) -> None:
+        first = TimelineEvent(date="2024-03-01", title="Spar", type="training", details="rounds")
+        repeat = TimelineEvent(date="2024-03-01", title="Spar", type="training", details="rounds")
+        other_year = TimelineEvent(date="2025-01-01", title="Plan", type="note", details="goals")
+        stored = self.manager.add_events([first, repeat, other_year])
+        self.assertEqual([event.id for event in stored], [first.id, first.id, other_year.id])
+        self.assertEqual(len(self.manager.load_year(2024)), 1)
+        self.assertIs(self.manager.add_event(repeat), stored[0])
+
+        reloaded = TimelineManager(base_path=self.base_path)
+        self.assertEqual(reloaded.add_event(repeat).id, first.id)
+        self.assertEqual(len((self.base_path / "2024.jsonl").read_text(encoding="utf-8").splitlines()), 1)
+
+    def test_add_events_fsyncs_each_shard_once_per_batch(self) -> None:
+        events = [
+            TimelineEvent(date=f"{year}-03-0{day}", title=f"Entry {day}", type="note", details=str(year))
+            for year in (2024, 2025)
+            for day in (1, 2, 3)
+        ]
+        with mock.patch("lorekeeper.timeline_manager.os.fsync") as fsync:
+            self.manager.add_events(events)
+        self.assertEqual(fsync.call_count, 2)
+
+    def test_voice_memo_batch_ingestion(self) -> None:
+        ingestor = VoiceMemoIngestor(self.manager)
+        memos = [
+            VoiceMemo(transcription="Morning run. Felt good.", recorded_at=datetime(2025, 2, 1, 7, 0, 0)),
+            VoiceMemo(transcription="Evening class. Drilled guard.", recorded_at=datetime(2025, 2, 1, 19, 0, 0)),
+        ]
+        events = ingestor.ingest_transcriptions(memos)
+        self.assertEqual([event.title for event in events], ["Morning run", "Evening class"])
+        self.assertEqual(len(self.manager.get_events(year=2025)), 2)
+
     def test_drift_auditor(self) -> None:
         events = [
             TimelineEvent(date="2025-02-01", title="Promotion", type="milestone", details="Blue belt"),
@@ -145,5 +386,104 @@ class TimelineManagerTests(unittest.TestCase):
         self.assertEqual(flags[0].issue, "Conflicting recounts")
 
 
+class TimelineCompactionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.base_path = Path(self.temp_dir.name)
+        self.manager = TimelineManager(base_path=self.base_path)
+        self.manager.add_events(
+            TimelineEvent(date=f"{year}-{month}", title=title, type="note", details=title.lower())
+            for year in (2019, 2020, 2021)
+            for month, title in (("06-01", "Summer"), ("01-01", "Winter"))
+        )
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_compacts_each_outdated_year_once(self) -> None:
+        paths = compact_outdated_shards(self.manager)
+        self.assertEqual(
+            [path.name for path in paths],
+            ["2019.compact.ndjson.gz", "2020.compact.ndjson.gz", "2021.compact.ndjson.gz"],
+        )
+        for year in (2019, 2020, 2021):
+            compacted = self.manager.load_compact_year(year)
+            self.assertEqual([event.title for event in compacted], ["Winter", "Summer"])
+
+    def test_compaction_drops_duplicate_event_ids(self) -> None:
+        shard = self.base_path / "2019.jsonl"
+        with shard.open("a", encoding="utf-8") as handle:
+            handle.write(shard.read_text(encoding="utf-8").splitlines()[0] + "\n")
+        with self.assertLogs("lorekeeper.timeline_compaction", level="INFO"):
+            compact_year(self.manager, 2019)
+        compacted = self.manager.load_compact_year(2019)
+        self.assertEqual(len(compacted), 2)
+        self.assertEqual(len({event.id for event in compacted}), 2)
+
+    def test_compaction_keeps_nan_and_wide_ints_on_both_json_backends(self) -> None:
+        metadata = {"big": 2**70, "ratio": math.nan}
+        self.manager.add_event(TimelineEvent(date="2019-03-01", title="Wide", type="note", details="x", metadata=metadata))
+        for backend in _JSON_BACKENDS:
+            with self.subTest(backend=backend), _json_backend(backend):
+                compact_year(self.manager, 2019)
+                wide = [event for event in self.manager.load_compact_year(2019) if event.title == "Wide"][0]
+                self.assertEqual(wide.metadata["big"], 2**70)
+                self.assertTrue(math.isnan(wide.metadata["ratio"]))
+
+    def test_failed_compaction_keeps_previous_shard(self) -> None:
+        compact_year(self.manager, 2019)
+        with mock.patch("lorekeeper.timeline_compaction._encode_record", side_effect=RuntimeError("disk full")):
+            with self.assertRaises(RuntimeError):
+                compact_year(self.manager, 2019)
+        self.assertEqual(len(self.manager.load_compact_year(2019)), 2)
+        self.assertEqual(list(self.base_path.glob("*.tmp")), [])
+
+    def test_load_compact_year_reads_legacy_json_arrays(self) -> None:
+        legacy = [{"date": "2018-05-05", "title": "Legacy", "type": "note", "details": "old format"}]
+        (self.base_path / "2018.compact.json").write_text(json.dumps(legacy), encoding="utf-8")
+        self.assertEqual([event.title for event in self.manager.load_compact_year(2018)], ["Legacy"])
+
+    def test_serial_and_parallel_compaction_match(self) -> None:
+        compact_outdated_shards(self.manager)
+        parallel = [self.manager.load_compact_year(year) for year in (2019, 2020, 2021)]
+        compact_outdated_shards(self.manager, max_workers=1, force=True)
+        serial = [self.manager.load_compact_year(year) for year in (2019, 2020, 2021)]
+        self.assertEqual(parallel, serial)
+
+    def test_skips_shards_that_are_already_compacted(self) -> None:
+        self.assertEqual(len(compact_outdated_shards(self.manager)), 3)
+        self.assertEqual(compact_outdated_shards(self.manager), [])
+        self.manager.add_event(TimelineEvent(date="2020-09-01", title="Autumn", type="note", details="new"))
+        self.assertEqual([path.name for path in compact_outdated_shards(self.manager)], ["2020.compact.ndjson.gz"])
+
+    def test_up_to_date_check_skips_hashing_unchanged_shards(self) -> None:
+        compact_outdated_shards(self.manager)
+        with mock.patch("lorekeeper.timeline_compaction._file_digest") as digest:
+            self.assertEqual(compact_outdated_shards(self.manager), [])
+        digest.assert_not_called()
+
+    def test_events_appended_during_compaction_are_picked_up_next_run(self) -> None:
+        real_compact_year = compact_year
+
+        def compact_then_append(manager: TimelineManager, year: int):
+            path = real_compact_year(manager, year)
+            if year == 2020:
+                manager.add_event(TimelineEvent(date="2020-09-01", title="Late", type="note", details="raced"))
+            return path
+
+        with mock.patch("lorekeeper.timeline_compaction.compact_year", side_effect=compact_then_append):
+            compact_outdated_shards(self.manager, max_workers=1)
+        self.assertEqual([path.name for path in compact_outdated_shards(self.manager)], ["2020.compact.ndjson.gz"])
+        self.assertIn("Late", [event.title for event in self.manager.load_compact_year(2020)])
+
+    def test_skips_legacy_only_years_that_are_already_compacted(self) -> None:
+        compact_outdated_shards(self.manager)
+        legacy = [{"id": "legacy-1", "date": "2017-07-04", "title": "Legacy", "type": "note", "details": "array shard"}]
+        (self.base_path / "2017.json").write_text(json.dumps(legacy), encoding="utf-8")
+        manager = TimelineManager(base_path=self.base_path)
+        self.assertEqual([path.name for path in compact_outdated_shards(manager)], ["2017.compact.ndjson.gz"])
+        self.assertEqual(compact_outdated_shards(manager), [])
+
+
 if __name__ == "__main__":
     unittest.main()
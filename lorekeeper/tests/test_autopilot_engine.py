@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 from lorekeeper.autopilot_engine import AutopilotEngine
 from lorekeeper.event_schema import TimelineEvent
@@ -11,27 +12,32 @@ class DummyInsight:
         return f"Summary of {len(data)} items"
 
 
-def build_engine():
+@lru_cache(maxsize=1)
+def _fixture_snapshot():
     base = datetime.now(UTC).date()
     wednesday = base + timedelta(days=(2 - base.weekday()))
-    timeline = [
+    timeline = (
         TimelineEvent(date=wednesday.isoformat(), title="Deep work", tags=["build"], metadata={"hour": 9}),
         TimelineEvent(date=(wednesday + timedelta(days=7)).isoformat(), title="Skill practice", tags=["skill"], metadata={"hour": 9}),
         TimelineEvent(date=(wednesday + timedelta(days=14)).isoformat(), title="Coaching", tags=["skill"], metadata={"hour": 15}),
         TimelineEvent(date=(wednesday + timedelta(days=1)).isoformat(), title="Reflection", tags=["journal"], metadata={"hour": 7}),
-    ]
+    )
 
     overdue_base = datetime.now(UTC) - timedelta(days=3)
-    tasks = [
+    tasks = tuple(
         {"title": f"Overdue {i}", "priority": 7 - i, "due_date": (overdue_base - timedelta(days=i)).isoformat(), "status": "incomplete", "category": "build"}
         for i in range(6)
-    ]
-    tasks.append({"title": "Completed", "priority": 3, "due_date": base.isoformat(), "status": "complete", "category": "health"})
+    ) + ({"title": "Completed", "priority": 3, "due_date": base.isoformat(), "status": "complete", "category": "health"},)
 
     identity = {"motifs": ["build", "skill"], "previous_motifs": ["stability"], "emotional_slope": -0.6}
     arcs = {"current_phase": "transition", "previous_phase": "momentum"}
+    return timeline, tasks, identity, arcs
+
 
-    return AutopilotEngine(DummyInsight(), timeline, tasks, identity, arcs)
+def build_engine():
+    # The fixture data is built once per session; each engine gets its own top-level containers.
+    timeline, tasks, identity, arcs = _fixture_snapshot()
+    return AutopilotEngine(DummyInsight(), timeline, tasks, dict(identity), dict(arcs))
 
 
 def test_cycle_detection_prefers_wednesday():
@@ -1,4 +1,7 @@
+import heapq
+from array import array
 from datetime import datetime
+from operator import itemgetter, mul
 
 from lorekeeper.hqi_engine import HQIEngine, MemoryEdge, MemoryFabric, MemoryNode
 
@@ -6,13 +9,12 @@ from lorekeeper.hqi_engine import HQIEngine, MemoryEdge, MemoryFabric, MemoryNod
 class DummyIndex:
     def __init__(self, fabric: MemoryFabric):
         self.fabric = fabric
+        self._rows = [(node.id, array("d", node.embedding)) for node in fabric.nodes.values()]
 
     def search(self, embedding, k: int = 10):
-        scores = []
-        for node in self.fabric.nodes.values():
-            scores.append((node.id, sum(a * b for a, b in zip(node.embedding, embedding))))
-        scores.sort(key=lambda item: item[1], reverse=True)
-        return scores[:k]
+        query = array("d", embedding)
+        scores = [(node_id, sum(map(mul, row, query))) for node_id, row in self._rows]
+        return heapq.nlargest(k, scores, key=itemgetter(1))
 
 
 def build_engine() -> tuple[HQIEngine, MemoryFabric]:
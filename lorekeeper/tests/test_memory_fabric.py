@@ -53,6 +53,14 @@ class MemoryFabricTests(unittest.TestCase):
         self.fabric.add_edge("b", "a", 1.0, "semantic")
         self.assertTrue(self.fabric.detect_cycles())
 
+    def test_cycle_detection_handles_deep_chains(self) -> None:
+        for index in range(3000):
+            self.fabric.add_node(FabricNode(f"n{index}", "event", {}, [1.0, 0.0], float(index)))
+        self.fabric.connect_temporal_chain(f"n{index}" for index in range(3000))
+        self.assertFalse(self.fabric.detect_cycles())
+        self.fabric.add_edge("n2999", "n0", 1.0, "semantic")
+        self.assertTrue(self.fabric.detect_cycles())
+
     def test_narrative_arc_mapping(self) -> None:
         arc = FabricNode("arc-1", "arc", {}, [0.1, 0.9], None)
         event_1 = FabricNode("event-1", "event", {}, [0.9, 0.1], 1.0)
@@ -1,39 +1,188 @@
 """Utilities for compacting append-only timeline shards into compact files."""
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
-from datetime import datetime, timedelta
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
+from threading import Lock
+from typing import Optional
 
-from .timeline_manager import TimelineManager
+from .timeline_manager import TimelineManager, _encode_record
+
+logger = logging.getLogger(__name__)
+
+# load_year also feeds the manager's in-memory indexes, which are not safe to
+# mutate from several threads at once; only the sort and write run in parallel.
+_LOAD_LOCK = Lock()
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory entry where the platform allows it."""
+
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def compact_year(manager: TimelineManager, year: int) -> Path:
     """Merge a year's append-only log into a compact, chronologically sorted shard."""
 
-    events = manager.load_year(year)
-    ordered = sorted(events, key=lambda e: (e.date, e.id))
-    compact_path = manager.base_path / f"{year}.compact.json"
-    compact_path.write_text(
-        json.dumps([event.__dict__ for event in ordered], indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    with _LOAD_LOCK:
+        events = manager.load_year(year)
+    # ISO dates sort lexicographically; precomputed keys avoid a lambda call per comparison.
+    keyed = [(event.date, event.id, event) for event in events]
+    keyed.sort(key=itemgetter(0, 1))
+    ordered = (event for _, _, event in keyed)
+    compact_path = manager.base_path / f"{year}.compact.ndjson.gz"
+    # Stream one gzip-compressed NDJSON line per event so peak memory stays at a single record.
+    # Sorting by (date, id) leaves retried writes adjacent, so duplicates drop in a single pass.
+    # Readers only ever see a complete shard: write a sibling temp file, fsync it, then rename.
+    previous_id: Optional[str] = None
+    skipped = 0
+    temp_path = compact_path.with_name(compact_path.name + ".tmp")
+    try:
+        with temp_path.open("wb") as raw:
+            with gzip.GzipFile(filename=compact_path.name, mode="wb", compresslevel=3, fileobj=raw) as handle:
+                for event in ordered:
+                    if event.id == previous_id:
+                        skipped += 1
+                        continue
+                    previous_id = event.id
+                    handle.write(_encode_record(asdict(event)) + b"\n")
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(temp_path, compact_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    _fsync_directory(compact_path.parent)
+    if skipped:
+        logger.info("Dropped %d duplicate events while compacting %s", skipped, year)
     return compact_path
 
 
-def compact_outdated_shards(manager: TimelineManager, horizon_days: int = 180) -> list[Path]:
-    """Compact shards older than the provided horizon (default 6 months)."""
+def _file_digest(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
 
-    threshold = datetime.utcnow().date() - timedelta(days=horizon_days)
-    targets: list[Path] = []
-    for path in manager.base_path.glob("*.json"):
-        try:
-            year = int(path.name.split(".")[0])
-        except ValueError:
+
+def _source_stamp(source_path: Path) -> dict:
+    # Stat before reading: if the log grows in between, the stamp's mtime is
+    # merely older than the file, which only costs a re-hash on the next check.
+    mtime_ns = source_path.stat().st_mtime_ns
+    data = source_path.read_bytes()
+    return {"size": len(data), "mtime_ns": mtime_ns, "sha1": _file_digest(data)}
+
+
+def _source_paths(manager: TimelineManager, year: int) -> list[Path]:
+    """Every file load_year reads for ``year``: the legacy JSON array and/or the append log."""
+
+    candidates = (manager._legacy_year_file(year), manager._year_file(year))
+    return [path for path in candidates if path.exists()]
+
+
+def _snapshot_sources(manager: TimelineManager, year: int) -> dict:
+    """Stamp the year's sources as they are *before* compaction reads them.
+
+    compact_year loads the shards afterwards, so it sees at least these bytes;
+    anything appended in between changes the size and the year is redone on
+    the next run instead of being skipped with the new events missing.
+    """
+
+    return {"sources": {path.name: _source_stamp(path) for path in _source_paths(manager, year)}}
+
+
+def _is_up_to_date(manager: TimelineManager, year: int) -> bool:
+    """Return True when the compact shard already reflects every source shard of the year.
+
+    Size and mtime decide the common cases; a source is only hashed when its
+    size still matches but its mtime moved (e.g. touched or rewritten in place).
+    """
+
+    sources = _source_paths(manager, year)
+    compact_path = manager.base_path / f"{year}.compact.ndjson.gz"
+    stamp_path = manager.base_path / f"{year}.compact.stamp"
+    if not sources or not compact_path.exists():
+        return False
+    try:
+        source_stats = {path.name: (path, path.stat()) for path in sources}
+        stamp = json.loads(stamp_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    stamped = stamp.get("sources") if isinstance(stamp, dict) else None
+    if not isinstance(stamped, dict) or stamped.keys() != source_stats.keys():
+        return False
+    for name, (path, source_stat) in source_stats.items():
+        entry = stamped[name]
+        if not isinstance(entry, dict) or entry.get("size") != source_stat.st_size:
+            return False
+        if entry.get("mtime_ns") == source_stat.st_mtime_ns:
             continue
-        if threshold.year > year:
-            targets.append(compact_year(manager, year))
-    return targets
+        try:
+            if entry.get("sha1") != _file_digest(path.read_bytes()):
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _write_stamp(manager: TimelineManager, year: int, stamp: dict) -> None:
+    if not stamp["sources"]:
+        return
+    stamp_path = manager.base_path / f"{year}.compact.stamp"
+    temp_path = stamp_path.with_name(stamp_path.name + ".tmp")
+    temp_path.write_text(json.dumps(stamp), encoding="utf-8")
+    os.replace(temp_path, stamp_path)
+
+
+def _compact_if_stale(manager: TimelineManager, year: int, force: bool) -> Optional[Path]:
+    if not force and _is_up_to_date(manager, year):
+        return None
+    stamp = _snapshot_sources(manager, year)
+    compact_path = compact_year(manager, year)
+    _write_stamp(manager, year, stamp)
+    return compact_path
+
+
+def compact_outdated_shards(
+    manager: TimelineManager,
+    horizon_days: int = 180,
+    max_workers: Optional[int] = None,
+    force: bool = False,
+) -> list[Path]:
+    """Compact shards older than the provided horizon (default 6 months).
+
+    Target years are collected up front and compacted concurrently; pass
+    ``max_workers=1`` to compact serially. Years whose compact shard is
+    already current are skipped unless ``force`` is set, so only rewritten
+    shards are returned.
+    """
+
+    threshold = (datetime.now(tz=timezone.utc) - timedelta(days=horizon_days)).date()
+    threshold_year = threshold.year
+    targets = [year for year in manager._shard_years() if threshold_year > year]
+    if not targets:
+        return []
+    workers = max_workers or min(32, len(targets))
+    if workers <= 1 or len(targets) == 1:
+        results = [_compact_if_stale(manager, year, force) for year in targets]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda year: _compact_if_stale(manager, year, force), targets))
+    return [path for path in results if path is not None]
 
 
 __all__ = ["compact_year", "compact_outdated_shards"]
@@ -1,29 +1,159 @@
 """Manager for sharded LoreKeeper timeline event storage.
 
 This module now keeps in-memory secondary indexes to provide near O(1)
-lookups by date, tag, type, and character involvement. Events are loaded in
-sorted order using bisect-based insertions so range queries operate in O(log n)
-time, and cached period windows avoid repeated scans. Disk writes remain
-append-only per year shard, with a companion compaction helper to merge shards
-for long-lived datasets.
+lookups by date, tag, type, and character involvement. Events are kept in
+date-sorted row lists (new rows are buffered and merged in one pass) so range
+queries operate in O(log n) time, and cached period windows avoid repeated
+scans. Disk writes remain append-only per year shard: each shard is a
+newline-delimited JSON log where new events and archive tombstones are
+appended, never rewritten. A companion compaction helper merges shards for
+long-lived datasets.
 """
 from __future__ import annotations
 
+import gzip
+import heapq
 import json
-import hashlib
+import math
+import os
+import sys
+from array import array
 from bisect import bisect_left, bisect_right
-from dataclasses import asdict
-from datetime import datetime, timedelta, date
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from datetime import date, timedelta
 from functools import lru_cache
+from itertools import compress, groupby
 from pathlib import Path
-from typing import Iterable, List, Optional, Dict
+from typing import BinaryIO, DefaultDict, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from .event_schema import TimelineEvent
-from .indexing import BPlusTree, SkipList, TagDictionary, SemanticCache
-from typing import DefaultDict, Iterable, List, Optional
+from .security import _json_loads, secure_iter_jsonl, secure_load_json
 
-from .event_schema import TimelineEvent
-from .security import secure_load_json
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _encode_record(record: dict) -> bytes:
+    """Serialize one shard record to compact UTF-8 JSON (no trailing newline).
+
+    orjson is used when it can represent the record exactly; otherwise the
+    stdlib ``json`` output is written, so a shard's contents never depend on
+    which backend is installed.
+    """
+
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib writes them exactly
+        else:
+            # orjson writes NaN and infinities as null; only a null in the output
+            # can hide one, so the record is walked just in that case.
+            if b"null" not in encoded or not _has_non_finite_float(record):
+                return encoded
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
+def _has_non_finite_float(value: object) -> bool:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+_decode_record = _json_loads
+
+
+def _seal_log_tail(handle: BinaryIO) -> None:
+    """Make sure the next append to a shard log starts on a fresh line.
+
+    An interrupted append can leave a final line without its newline. If that
+    line still parses it is terminated; otherwise it is cut off, since the
+    loader would skip it anyway and a record appended after it would be lost
+    with it.
+    """
+
+    end = handle.seek(0, os.SEEK_END)
+    if not end:
+        return
+    handle.seek(end - 1)
+    if handle.read(1) == b"\n":
+        return
+    start = 0
+    position = end
+    while position > 0:
+        step = min(4096, position)
+        position -= step
+        handle.seek(position)
+        newline = handle.read(step).rfind(b"\n")
+        if newline != -1:
+            start = position + newline + 1
+            break
+    handle.seek(start)
+    try:
+        _decode_record(handle.read())
+    except ValueError:
+        handle.truncate(start)
+    else:
+        handle.write(b"\n")
+
+
+def _event_year(iso_date: str) -> int:
+    """Year of an ISO-8601 date string; the first four characters are always the year."""
+
+    return int(iso_date[:4])
+
+
+# Entries kept in the rolling-window cache; override with LOREKEEPER_PERIOD_CACHE_SIZE.
+DEFAULT_PERIOD_CACHE_SIZE = 256
+
+
+def _union_posting_lists(postings: List[Sequence[int]]) -> Iterator[int]:
+    """Yield each row appearing in any of the ascending ``postings`` once, in order."""
+
+    merged = postings[0] if len(postings) == 1 else heapq.merge(*postings)
+    previous = None
+    for row in merged:
+        if row != previous:
+            yield row
+            previous = row
+
+
+# Rolling windows ending on (and including) the reference day.
+_PERIOD_WINDOWS = {
+    "last_7_days": timedelta(days=6),
+    "last_30_days": timedelta(days=29),
+    "last_3_months": timedelta(days=90),
+}
+
+
+@lru_cache(maxsize=32)
+def _period_range_for(period: str, today_iso: str) -> tuple[str, str]:
+    """ISO ``(start, end)`` bounds of a named period relative to ``today_iso``."""
+
+    if period == "this_year":
+        return f"{today_iso[:4]}-01-01", today_iso
+    window = _PERIOD_WINDOWS.get(period)
+    if window is None:
+        raise ValueError(f"Unsupported period: {period}")
+    return (date.fromisoformat(today_iso) - window).isoformat(), today_iso
+
+
+# Content fields that identify a duplicate ingestion (date, title, type, details).
+IngestionKey = Tuple[str, str, str, str]
+
+# Archive markers appended to a shard log; replayed onto the matching event on load.
+_TOMBSTONE_KEYS = frozenset({"id", "archived"})
 
 
 class TimelineManager:
@@ -32,134 +162,268 @@ class TimelineManager:
     def __init__(self, base_path: Path | None = None) -> None:
         self.base_path = base_path or Path(__file__).resolve().parent / "timeline"
         self.base_path.mkdir(parents=True, exist_ok=True)
-        self.date_index: BPlusTree[str, TimelineEvent] = BPlusTree()
-        self.recency_index: SkipList[str, TimelineEvent] = SkipList()
-        self.tag_index = TagDictionary()
-        self.semantic_cache = SemanticCache(capacity=200)
-        self._events_by_id: Dict[str, TimelineEvent] = {}
-        self._refresh_indexes()
-
-        # Primary storage and indexes
-        self.events_by_id: dict[str, TimelineEvent] = {}
-        self.sorted_event_ids: List[str] = []
+
+        # Primary storage: column-per-field tables addressed by an integer row.
+        # Filters read the narrow columns (dates, archived flags) and only touch
+        # the full event payload for rows that survive.
+        self._row_ids: List[str] = []
+        self._dates: List[str] = []
+        self._archived = bytearray()
+        self._year_of = array("H")
+        self._payload: List[TimelineEvent] = []
+        self._row_of: Dict[str, int] = {}
+
+        # Date-ordered row lists for bisect range queries, each with a parallel
+        # live mask (1 = not archived) so slices are filtered by compress() in C.
+        self.sorted_rows: List[int] = []
         self.sorted_dates: List[str] = []
-        self.year_index: DefaultDict[int, List[str]] = DefaultDict(list)
+        self.sorted_live = bytearray()
+        self.year_index: DefaultDict[int, List[int]] = DefaultDict(list)
         self.year_dates: DefaultDict[int, List[str]] = DefaultDict(list)
-
-        # Secondary lookups
-        self.index_by_date: DefaultDict[str, List[str]] = DefaultDict(list)
-        self.index_by_tag: DefaultDict[str, List[str]] = DefaultDict(list)
-        self.index_by_type: DefaultDict[str, List[str]] = DefaultDict(list)
-        self.index_by_character: DefaultDict[str, List[str]] = DefaultDict(list)
-        self.index_by_hash: dict[str, str] = {}
+        self.year_live: DefaultDict[int, bytearray] = DefaultDict(bytearray)
+        # Rows indexed since the last query; merged into the sorted lists lazily
+        self._unsorted_rows: List[int] = []
+
+        # Secondary lookups (values are row numbers)
+        self.index_by_date: DefaultDict[str, List[int]] = DefaultDict(list)
+        # Tag posting lists are append-only, so rows stay in ascending order.
+        self.index_by_tag: DefaultDict[str, array] = DefaultDict(lambda: array("i"))
+        self.index_by_type: DefaultDict[str, List[int]] = DefaultDict(list)
+        self.index_by_character: DefaultDict[str, List[int]] = DefaultDict(list)
+        # Built lazily by _sync_hash_index so startup never pays for dedup keys;
+        # covers rows below _hashed_rows.
+        self.index_by_hash: dict[IngestionKey, int] = {}
+        self._hashed_rows = 0
 
         # Caching for rolling windows
-        self._period_cache: dict[tuple[str, str], List[str]] = {}
+        self._period_cache: OrderedDict[tuple[str, str, bool], array] = OrderedDict()
+        # Whole-week row buckets shared by overlapping period windows
+        self._bucket_cache: OrderedDict[tuple[str, str, bool], tuple[int, ...]] = OrderedDict()
+        self._period_cache_size = max(
+            1, int(os.environ.get("LOREKEEPER_PERIOD_CACHE_SIZE", DEFAULT_PERIOD_CACHE_SIZE))
+        )
 
         self._bootstrap_from_disk()
 
     def _year_file(self, year: int) -> Path:
+        return self.base_path / f"{year}.jsonl"
+
+    def _legacy_year_file(self, year: int) -> Path:
         return self.base_path / f"{year}.json"
 
     def _compact_file(self, year: int) -> Path:
+        return self.base_path / f"{year}.compact.ndjson.gz"
+
+    def _legacy_compact_file(self, year: int) -> Path:
         return self.base_path / f"{year}.compact.json"
 
+    def _shard_years(self) -> List[int]:
+        """Return the years that have an append log or a legacy JSON shard on disk."""
+
+        years: set[int] = set()
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if ".compact." in name or not name.endswith((".jsonl", ".json")):
+                    continue
+                try:
+                    years.add(int(name.partition(".")[0]))
+                except ValueError:
+                    continue
+        return sorted(years)
+
     def _load_raw_year(self, year: int) -> List[dict]:
-        path = self._year_file(year)
-        return secure_load_json(path, base_dir=self.base_path)
-        """Load a specific year's shard, preferring compacted data when present."""
+        """Replay a year's shard: legacy JSON array first, then the append log."""
+
+        records: List[dict] = []
+        positions: Dict[str, int] = {}
+        legacy_path = self._legacy_year_file(year)
+        if legacy_path.exists():
+            records.extend(secure_load_json(legacy_path, base_dir=self.base_path))
+            positions = {item["id"]: index for index, item in enumerate(records)}
+        for item in secure_iter_jsonl(self._year_file(year), base_dir=self.base_path):
+            if item.keys() == _TOMBSTONE_KEYS:
+                position = positions.get(item["id"])
+                if position is not None:
+                    records[position] = {**records[position], "archived": item["archived"]}
+                continue
+            positions.setdefault(item["id"], len(records))
+            records.append(item)
+        return records
 
-        compact_path = self._compact_file(year)
-        path = compact_path if compact_path.exists() else self._year_file(year)
-        if not path.exists():
-            path.write_text("[]", encoding="utf-8")
-            return []
-        return json.loads(path.read_text(encoding="utf-8"))
+    def _append_raw(self, year: int, records: Iterable[dict], durable: bool = False) -> None:
+        """Append records to a year's log without touching existing lines.
 
-    def _index_event(self, event: TimelineEvent) -> None:
-        if event.id in self._events_by_id:
-            return
-        self._events_by_id[event.id] = event
-        self.date_index.insert(event.date, event)
-        self.recency_index.insert(event.date, event)
-        self.tag_index.add(event.id, event.tags)
-
-    def _refresh_indexes(self) -> None:
-        self.date_index = BPlusTree()
-        self.recency_index = SkipList()
-        self.tag_index = TagDictionary()
-        self._events_by_id = {}
-
-        for path in sorted(self.base_path.glob("*.json")):
-            try:
-                year_number = int(path.stem)
-            except ValueError:
-                continue
-            for item in self._load_raw_year(year_number):
-                event = TimelineEvent(**item)
-                self._index_event(event)
+        With ``durable`` the log is fsynced once after the whole batch is written.
+        """
 
-    def _save_year(self, year: int, events: Iterable[dict]) -> None:
-        path = self._year_file(year)
-        path.write_text(json.dumps(list(events), indent=2, ensure_ascii=False), encoding="utf-8")
+        # Stream through the file buffer rather than joining the whole batch, so
+        # peak memory stays at one encoded record however large the import.
+        with self._year_file(year).open("a+b") as handle:
+            _seal_log_tail(handle)
+            handle.writelines(_encode_record(record) + b"\n" for record in records)
+            if durable:
+                handle.flush()
+                os.fsync(handle.fileno())
 
     def _bootstrap_from_disk(self) -> None:
         """Load all shards and build in-memory indexes for near O(1) retrieval."""
 
-        year_candidates: set[int] = set()
-        for path in self.base_path.glob("*.json"):
-            name = path.name
-            try:
-                year = int(name.split(".")[0])
-            except ValueError:
-                continue
-            year_candidates.add(year)
+        # load_year indexes as it goes; rows are buffered, then sorted once.
+        for year in self._shard_years():
+            self.load_year(year)
+        self._ensure_sorted()
+
+    @staticmethod
+    def _compute_ingestion_hash(event: TimelineEvent) -> IngestionKey:
+        # Dedup needs no cryptographic digest: keying the dict by the fields
+        # themselves reuses each string's cached hash and cannot collide.
+        return (event.date, event.title, event.type, event.details)
+
+    def _insert_sorted_event(self, event: TimelineEvent, row: int) -> None:
+        # Inserting into the middle of the sorted lists costs O(n) per event, so
+        # new rows are buffered and merged in one pass before the next query.
+        self._unsorted_rows.append(row)
+
+    def _merge_rows(self, dates: List[str], rows: List[int], live: bytearray, new_rows: List[int]) -> None:
+        """Merge date-sorted ``new_rows`` into the parallel ``dates``/``rows``/``live`` lists in place."""
+
+        column = self._dates
+        archived = self._archived
+        if not dates or column[new_rows[0]] >= dates[-1]:
+            # chronological ingestion: a plain append keeps the order
+            rows.extend(new_rows)
+            dates.extend(column[row] for row in new_rows)
+            live.extend(archived[row] ^ 1 for row in new_rows)
+            return
+        # Both runs are already sorted, so timsort merges them in linear time.
+        merged = sorted(rows + new_rows, key=lambda row: (column[row], row))
+        rows[:] = merged
+        dates[:] = [column[row] for row in merged]
+        live[:] = bytes(archived[row] ^ 1 for row in merged)
 
-        for year in sorted(year_candidates):
-            for event in self.load_year(year):
-                self._index_event(event)
+    def _ensure_sorted(self) -> None:
+        """Fold rows buffered by ``_insert_sorted_event`` into the sorted lists."""
 
-    def _compute_ingestion_hash(self, event: TimelineEvent) -> str:
-        payload = f"{event.date}|{event.title}|{event.type}|{event.details}"
-        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
-    def _insert_sorted_event(self, event: TimelineEvent) -> None:
-        position = bisect_right(self.sorted_dates, event.date)
-        self.sorted_dates.insert(position, event.date)
-        self.sorted_event_ids.insert(position, event.id)
-        # maintain year-specific sorted order
-        event_year = datetime.fromisoformat(event.date).year
-        year_dates = self.year_dates[event_year]
-        year_ids = self.year_index[event_year]
-        year_pos = bisect_right(year_dates, event.date)
-        year_dates.insert(year_pos, event.date)
-        year_ids.insert(year_pos, event.id)
+        if not self._unsorted_rows:
+            return
+        column = self._dates
+        pending = sorted(self._unsorted_rows, key=lambda row: (column[row], row))
+        self._unsorted_rows = []
+        self._merge_rows(self.sorted_dates, self.sorted_rows, self.sorted_live, pending)
+
+        # pending is date-ordered, so each year's rows form one contiguous run
+        for event_year, year_rows in groupby(pending, key=self._year_of.__getitem__):
+            self._merge_rows(
+                self.year_dates[event_year], self.year_index[event_year], self.year_live[event_year], list(year_rows)
+            )
 
     def _index_event(self, event: TimelineEvent) -> None:
-        if event.id in self.events_by_id:
+        if event.id in self._row_of:
             return
 
-        self.events_by_id[event.id] = event
-        self._insert_sorted_event(event)
+        row = len(self._row_ids)
+        self._row_of[event.id] = row
+        self._row_ids.append(event.id)
+        self._dates.append(event.date)
+        self._year_of.append(_event_year(event.date))
+        self._archived.append(1 if event.archived else 0)
+        self._payload.append(event)
+        self._insert_sorted_event(event, row)
 
-        self.index_by_date[event.date].append(event.id)
+        self.index_by_date[event.date].append(row)
         if event.type:
-            self.index_by_type[event.type].append(event.id)
+            self.index_by_type[event.type].append(row)
         for tag in event.tags:
-            self.index_by_tag[tag.lower()].append(event.id)
+            # lower() builds a fresh string; interning lets the lookup hit the
+            # stored key by identity instead of comparing characters.
+            self.index_by_tag[sys.intern(tag.lower())].append(row)
         if isinstance(event.metadata, dict):
             characters = event.metadata.get("characters") or []
             for character_id in characters:
-                self.index_by_character[str(character_id)].append(event.id)
-        ingestion_hash = self._compute_ingestion_hash(event)
-        self.index_by_hash.setdefault(ingestion_hash, event.id)
+                self.index_by_character[str(character_id)].append(row)
 
-    def _invalidate_cache(self) -> None:
-        self._period_cache.clear()
-        self._get_events_for_period.cache_clear()
+    def _sync_hash_index(self) -> None:
+        """Catch the dedup index up with rows indexed since it was last consulted."""
+
+        index = self.index_by_hash
+        payload = self._payload
+        for row in range(self._hashed_rows, len(payload)):
+            index.setdefault(self._compute_ingestion_hash(payload[row]), row)
+        self._hashed_rows = len(payload)
+
+    def _replace_row(self, row: int, event: TimelineEvent) -> None:
+        """Swap in an updated immutable event for an existing row (e.g. after archiving)."""
+
+        self._payload[row] = event
+        flag = 1 if event.archived else 0
+        if self._archived[row] == flag:
+            return
+        self._archived[row] = flag
+        self._ensure_sorted()
+        date_key = self._dates[row]
+        year_key = self._year_of[row]
+        for dates, rows, live in (
+            (self.sorted_dates, self.sorted_rows, self.sorted_live),
+            (self.year_dates[year_key], self.year_index[year_key], self.year_live[year_key]),
+        ):
+            # rows sharing a date are contiguous, so the scan stays short
+            position = bisect_left(dates, date_key)
+            while rows[position] != row:
+                position += 1
+            live[position] = flag ^ 1
+
+    def get_event(self, event_id: str) -> Optional[TimelineEvent]:
+        """Return the stored event with ``event_id``, if any."""
+
+        row = self._row_of.get(event_id)
+        return None if row is None else self._payload[row]
+
+    def _row_order(self, row: int) -> tuple[str, int]:
+        return self._dates[row], row
+
+    def _drop_buckets_containing(self, event_date: str, include_archived: Optional[bool] = None) -> None:
+        for key in [
+            key
+            for key in self._bucket_cache
+            if key[0] <= event_date[:10] <= key[1] and include_archived in (None, key[2])
+        ]:
+            del self._bucket_cache[key]
+
+    def _touch_cache(self, new_rows: Iterable[int]) -> None:
+        """Upsert freshly indexed rows into the cached windows whose range they fall in.
+
+        Windows that do not cover a row's date are left alone instead of being
+        rebuilt, so one insert costs a bisect per affected window.
+        """
+
+        archived = self._archived
+        dates = self._dates
+        for row in new_rows:
+            event_date = dates[row]
+            for (period, today_iso, include_archived), cached_rows in self._period_cache.items():
+                if archived[row] and not include_archived:
+                    continue
+                start, end = _period_range_for(period, today_iso)
+                if start <= event_date <= end:
+                    position = bisect_right(cached_rows, self._row_order(row), key=self._row_order)
+                    cached_rows.insert(position, row)
+            self._drop_buckets_containing(event_date)
+
+    def _touch_cache_archived(self, row: int) -> None:
+        """Drop a newly archived row from the windows that exclude archived events."""
+
+        order = self._row_order(row)
+        for (_, _, include_archived), cached_rows in self._period_cache.items():
+            if include_archived:
+                continue
+            position = bisect_left(cached_rows, order, key=self._row_order)
+            if position < len(cached_rows) and cached_rows[position] == row:
+                del cached_rows[position]
+        self._drop_buckets_containing(self._dates[row], include_archived=False)
 
     def load_year(self, year: int) -> List[TimelineEvent]:
-        """Load all events for a given year, initializing the file if needed."""
+        """Load all events for a given year with archive tombstones applied."""
 
         raw_events = self._load_raw_year(year)
         events: List[TimelineEvent] = []
@@ -169,23 +433,60 @@ class TimelineManager:
             self._index_event(event)
         return events
 
+    def load_compact_year(self, year: int) -> List[TimelineEvent]:
+        """Load a compacted shard, streaming gzip NDJSON and falling back to legacy JSON arrays."""
+
+        compact_path = self._compact_file(year)
+        if compact_path.exists():
+            with gzip.open(compact_path, "rb") as handle:
+                return [TimelineEvent(**_decode_record(line)) for line in handle if line.strip()]
+        legacy_path = self._legacy_compact_file(year)
+        if legacy_path.exists():
+            return [TimelineEvent(**item) for item in secure_load_json(legacy_path, base_dir=self.base_path)]
+        return []
+
     def add_event(self, event: TimelineEvent) -> TimelineEvent:
         """Append a new immutable event into its year shard without modifying existing data."""
 
-        ingestion_hash = self._compute_ingestion_hash(event)
-        existing_id = self.index_by_hash.get(ingestion_hash)
-        if existing_id:
-            return self.events_by_id[existing_id]
+        return self.add_events([event])[0]
+
+    def add_events(self, events: Iterable[TimelineEvent]) -> List[TimelineEvent]:
+        """Append many events, touching each affected year shard only once.
 
-        event_year = datetime.fromisoformat(event.date).year
-        events = self._load_raw_year(event_year)
-        events.append(asdict(event))
-        self._save_year(event_year, events)
-        self._index_event(event)
+        Returns the stored event for each input in order; duplicates (already on
+        disk or repeated within the batch) resolve to the first stored copy.
+        """
 
-        self._index_event(event)
-        self._invalidate_cache()
-        return event
+        stored: List[TimelineEvent] = []
+        pending_by_year: Dict[int, List[TimelineEvent]] = {}
+        batch_by_hash: Dict[IngestionKey, TimelineEvent] = {}
+        self._sync_hash_index()
+        for event in events:
+            ingestion_hash = self._compute_ingestion_hash(event)
+            existing_row = self.index_by_hash.get(ingestion_hash)
+            if existing_row is not None:
+                stored.append(self._payload[existing_row])
+                continue
+            if ingestion_hash in batch_by_hash:
+                stored.append(batch_by_hash[ingestion_hash])
+                continue
+            batch_by_hash[ingestion_hash] = event
+            event_year = _event_year(event.date)
+            pending_by_year.setdefault(event_year, []).append(event)
+            stored.append(event)
+
+        if not pending_by_year:
+            return stored
+
+        # One open and one fsync per affected shard, however many events it gets.
+        first_row = len(self._row_ids)
+        for event_year, new_events in pending_by_year.items():
+            self._append_raw(event_year, (asdict(event) for event in new_events), durable=True)
+            for event in new_events:
+                self._index_event(event)
+
+        self._touch_cache(range(first_row, len(self._row_ids)))
+        return stored
 
     def get_events(
         self,
@@ -195,86 +496,119 @@ class TimelineManager:
         tags: Optional[List[str]] = None,
         include_archived: bool = False,
     ) -> List[TimelineEvent]:
-        """Retrieve events filtered by year, date range, and tags."""
-
-        tags = tags or []
-        candidates: List[TimelineEvent]
-        if tags:
-            tag_sets = [self.tag_index.get(tag) for tag in tags]
-            if not tag_sets:
-                return []
-            matching_ids = set.intersection(*tag_sets) if len(tag_sets) > 1 else tag_sets[0]
-            candidates = [self._events_by_id[event_id] for event_id in matching_ids if event_id in self._events_by_id]
-        elif start_date or end_date:
-            candidates = self.date_index.range_query(start=start_date, end=end_date)
-        else:
-            candidates = list(self._events_by_id.values())
-        tags = [tag.lower() for tag in (tags or [])]
-        candidates: List[TimelineEvent] = []
-
-        if start_date or end_date:
-            start = start_date or "0000-01-01"
-            end = end_date or "9999-12-31"
-            candidates.extend(self.get_events_between(start, end))
-        elif year is not None:
-            candidates.extend([self.events_by_id[eid] for eid in self.year_index.get(year, [])])
-        else:
-            candidates.extend([self.events_by_id[eid] for eid in self.sorted_event_ids])
+        """Retrieve events filtered by year, date range, and tags, in date order.
 
-        if tags:
-            tag_sets = [set(self.index_by_tag.get(tag, [])) for tag in tags]
-            allowed_ids = set.union(*tag_sets) if tag_sets else set()
-        else:
-            allowed_ids = None
-
-        def in_range(event: TimelineEvent) -> bool:
-            if not include_archived and event.archived:
-                return False
-            if year is not None and not str(getattr(event, "date", "")).startswith(str(year)):
-                return False
-            if tags and not set(tags).intersection(event.tags):
-                return False
-            if allowed_ids is not None and event.id not in allowed_ids:
-                return False
-            if start_date and event.date < start_date:
-                return False
-            if end_date and event.date > end_date:
-                return False
-            return True
-
-        return sorted((event for event in candidates if in_range(event)), key=lambda e: e.date)
+        Date bounds are resolved by bisecting the date-sorted row index, so a
+        narrow window (e.g. a weekly arc) costs O(log n + k), not a full scan.
+        """
+
+        tags = [sys.intern(tag.lower()) for tag in (tags or [])]
+        self._ensure_sorted()
+
+        payload = self._payload
+        if not tags:
+            # Both the global and per-year lists are kept in date order, so range
+            # filters resolve to a bisected slice instead of a full scan.
+            if year is not None:
+                columns = (self.year_dates.get(year, []), self.year_index.get(year, []), self.year_live.get(year, b""))
+            else:
+                columns = (self.sorted_dates, self.sorted_rows, self.sorted_live)
+            return [payload[row] for row in self._slice_rows(*columns, start_date, end_date, include_archived)]
+
+        # Drive the query from the merged tag posting lists, which are usually
+        # far shorter than the date range they are filtered by. Every check reads
+        # a local column; the payload is only touched for surviving rows.
+        dates = self._dates
+        year_of = self._year_of
+        archived = self._archived
+        candidates = [
+            row
+            for row in _union_posting_lists([self.index_by_tag.get(tag, ()) for tag in tags])
+            if (include_archived or not archived[row])
+            and (year is None or year_of[row] == year)
+            and (not start_date or dates[row] >= start_date)
+            and (not end_date or dates[row] <= end_date)
+        ]
+        candidates.sort(key=lambda row: (dates[row], row))
+        # The index is case-folded; keep only events that carry a requested tag verbatim.
+        wanted = frozenset(tags)
+        return [payload[row] for row in candidates if not wanted.isdisjoint(payload[row].tags)]
 
     def get_events_between(self, start: str, end: str) -> List[TimelineEvent]:
         """Return events within an inclusive ISO date range using bisect lookups."""
 
-        start_idx = bisect_left(self.sorted_dates, start)
-        end_idx = bisect_right(self.sorted_dates, end)
-        return [self.events_by_id[eid] for eid in self.sorted_event_ids[start_idx:end_idx]]
-
-    @lru_cache(maxsize=1024)
-    def _get_events_for_period(self, start: str, end: str, include_archived: bool) -> tuple[str, ...]:
-        events = self.get_events_between(start, end)
+        payload = self._payload
+        return [payload[row] for row in self._rows_between(start, end)]
+
+    def _rows_between(self, start: str, end: str, include_archived: bool = True) -> List[int]:
+        self._ensure_sorted()
+        return self._slice_rows(self.sorted_dates, self.sorted_rows, self.sorted_live, start, end, include_archived)
+
+    @staticmethod
+    def _slice_rows(
+        dates: List[str],
+        rows: List[int],
+        live: bytes,
+        start: Optional[str],
+        end: Optional[str],
+        include_archived: bool,
+    ) -> List[int]:
+        """Rows whose date falls in ``[start, end]``, dropping archived ones via the live mask."""
+
+        start_idx = bisect_left(dates, start) if start else 0
+        end_idx = bisect_right(dates, end) if end else len(dates)
         if include_archived:
-            return tuple(event.id for event in events)
-        return tuple(event.id for event in events if not event.archived)
+            return rows[start_idx:end_idx]
+        return list(compress(rows[start_idx:end_idx], live[start_idx:end_idx]))
+
+    def _get_events_for_period(self, start: str, end: str, include_archived: bool) -> tuple[int, ...]:
+        """Rows in ``[start, end]``, reusing cached whole-week buckets for the middle.
+
+        Rolling windows shift by a day at a time, so their exact bounds rarely
+        repeat; the Monday-to-Sunday weeks they cover do. Only the partial weeks
+        at either edge are sliced fresh.
+        """
+
+        self._ensure_sorted()
+        first_day = date.fromisoformat(start[:10])
+        last_day = date.fromisoformat(end[:10])
+        week_start = first_day + timedelta(days=-first_day.weekday() % 7)
+        week_end = last_day - timedelta(days=(last_day.weekday() + 1) % 7)
+        if week_start > week_end:
+            return tuple(self._rows_between(start, end, include_archived))
+
+        dates = self.sorted_dates
+        lo = bisect_left(dates, start)
+        mid_lo = bisect_left(dates, week_start.isoformat())
+        mid_hi = bisect_right(dates, week_end.isoformat())
+        hi = bisect_right(dates, end)
+
+        key = (week_start.isoformat(), week_end.isoformat(), include_archived)
+        middle = self._bucket_cache.get(key)
+        if middle is None:
+            middle = tuple(self._rows_in(mid_lo, mid_hi, include_archived))
+            if len(self._bucket_cache) >= self._period_cache_size:
+                self._bucket_cache.popitem(last=False)
+            self._bucket_cache[key] = middle
+        else:
+            self._bucket_cache.move_to_end(key)
+        return (
+            tuple(self._rows_in(lo, mid_lo, include_archived))
+            + middle
+            + tuple(self._rows_in(mid_hi, hi, include_archived))
+        )
+
+    def _rows_in(self, start_idx: int, end_idx: int, include_archived: bool) -> List[int]:
+        rows = self.sorted_rows[start_idx:end_idx]
+        if include_archived:
+            return rows
+        return list(compress(rows, self.sorted_live[start_idx:end_idx]))
 
     def _resolve_period_range(self, period: str, reference_date: Optional[date] = None) -> tuple[str, str]:
         """Translate a named period into an ISO date range inclusive of the reference date."""
 
-        today = reference_date or datetime.utcnow().date()
-
-        if period == "last_7_days":
-            start = today - timedelta(days=6)
-        elif period == "last_30_days":
-            start = today - timedelta(days=29)
-        elif period == "last_3_months":
-            start = today - timedelta(days=90)
-        elif period == "this_year":
-            start = date(year=today.year, month=1, day=1)
-        else:
-            raise ValueError(f"Unsupported period: {period}")
-
-        return start.isoformat(), today.isoformat()
+        today = reference_date or date.today()
+        return _period_range_for(period, today.isoformat())
 
     def get_events_by_period(
         self,
@@ -285,17 +619,21 @@ class TimelineManager:
     ) -> List[TimelineEvent]:
         """Convenience wrapper to fetch events for a named context window."""
 
-        reference = reference_date or datetime.utcnow().date()
-        cache_key = (period, reference.isoformat(), include_archived)
-        cached_ids = self._period_cache.get(cache_key)
-        if cached_ids is not None and not tags:
-            return [self.events_by_id[eid] for eid in cached_ids]
+        today_iso = (reference_date or date.today()).isoformat()
+        cache_key = (period, today_iso, include_archived)
+        cache = self._period_cache
+        cached_rows = cache.get(cache_key)
+        if cached_rows is not None and not tags:
+            cache.move_to_end(cache_key)
+            return [self._payload[row] for row in cached_rows]
 
-        start_date, end_date = self._resolve_period_range(period, reference_date=reference)
+        start_date, end_date = _period_range_for(period, today_iso)
         if not tags:
-            cached_ids = self._get_events_for_period(start_date, end_date, include_archived)
-            events = [self.events_by_id[eid] for eid in cached_ids]
-            self._period_cache[cache_key] = list(cached_ids)
+            cached_rows = array("i", self._get_events_for_period(start_date, end_date, include_archived))
+            events = [self._payload[row] for row in cached_rows]
+            if len(cache) >= self._period_cache_size:
+                cache.popitem(last=False)
+            cache[cache_key] = cached_rows
         else:
             events = self.get_events(start_date=start_date, end_date=end_date, tags=tags, include_archived=include_archived)
         return events
@@ -303,28 +641,19 @@ class TimelineManager:
     def archive_event(self, event_id: str) -> Optional[TimelineEvent]:
         """Mark an event as archived while keeping it in the shard."""
 
-        for path in self.base_path.glob("*.json"):
-            try:
-                year = int(path.name.split(".")[0])
-            except ValueError:
-                continue
-            events = self._load_raw_year(year)
-            updated = []
-            archived_event: Optional[TimelineEvent] = None
-            for item in events:
-                if item["id"] == event_id:
-                    if not item.get("archived", False):
-                        item["archived"] = True
-                    archived_event = TimelineEvent(**item)
-                updated.append(item)
-            if archived_event:
-                self._save_year(year, updated)
-                self._refresh_indexes()
-                # refresh the in-memory representation
-                self.events_by_id[event_id] = archived_event
-                self._invalidate_cache()
-                return archived_event
-        return None
+        # Every shard is indexed at startup, so the row already knows the
+        # event's year; only that log gets the tombstone.
+        row = self._row_of.get(event_id)
+        if row is None:
+            return None
+        event = self._payload[row]
+        if event.archived:
+            return event
+        archived_event = replace(event, archived=True)
+        self._append_raw(self._year_of[row], [{"id": event_id, "archived": True}])
+        self._replace_row(row, archived_event)
+        self._touch_cache_archived(row)
+        return archived_event
 
     def correct_event(self, event_id: str, corrected_event: TimelineEvent) -> Optional[TimelineEvent]:
         """Archive the original event and append a corrected replacement."""
@@ -345,5 +674,4 @@ class TimelineManager:
                 archived=corrected_event.archived,
             )
         self.add_event(corrected)
-        self._refresh_indexes()
         return corrected
@@ -4,13 +4,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, List, Optional
 
 from .event_schema import TimelineEvent
 from .timeline_manager import TimelineManager
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceMemo:
     """Simple representation of an ingested voice memo."""
 
@@ -28,14 +28,24 @@ class VoiceMemoIngestor:
         self.manager = manager
 
     def ingest_transcription(self, memo: VoiceMemo) -> TimelineEvent:
-        title = memo.transcription.split(". ")[0][:80]
+        return self.manager.add_event(self._build_event(memo))
+
+    def ingest_transcriptions(self, memos: Iterable[VoiceMemo]) -> List[TimelineEvent]:
+        """Ingest several memos with a single write per affected year shard."""
+
+        return self.manager.add_events(self._build_event(memo) for memo in memos)
+
+    def _build_event(self, memo: VoiceMemo) -> TimelineEvent:
+        # Only a sentence break starting within the first 80 characters can
+        # shorten the title, so there is no need to scan the whole transcript.
+        title = memo.transcription[:81].partition(". ")[0][:80]
         tags = memo.tags or []
         metadata = {
             "ingestion": "voice_memo",
             "device": memo.device,
             "source_uri": str(memo.source_uri) if memo.source_uri else None,
         }
-        event = TimelineEvent(
+        return TimelineEvent(
             date=memo.recorded_at.date().isoformat(),
             title=title,
             type="voice_memo",
@@ -44,7 +54,6 @@ class VoiceMemoIngestor:
             source="voice_memo",
             metadata=metadata,
         )
-        return self.manager.add_event(event)
 
     def ingest_audio_file(self, path: Path, transcription: str, recorded_at: Optional[datetime] = None, tags: Optional[List[str]] = None) -> TimelineEvent:
         recorded_time = recorded_at or datetime.utcnow()
@@ -1,4 +1,12 @@
 """Weekly arc package for LoreKeeper."""
-from .arc_engine import WeeklyArcEngine
+from importlib import import_module
+from typing import Any
 
 __all__ = ["WeeklyArcEngine"]
+
+
+def __getattr__(name: str) -> Any:
+    # Loaded on first access so ``python -m lorekeeper.weekly_arc --help`` stays light.
+    if name == "WeeklyArcEngine":
+        return import_module(".arc_engine", __name__).WeeklyArcEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,9 @@
 """CLI entrypoint for generating the latest weekly arc."""
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 
-from ..drift_auditor import DriftAuditor
-from ..narrative_stitcher import NarrativeStitcher
-from ..timeline_manager import TimelineManager
-from .arc_engine import WeeklyArcEngine
-
 
 class _FallbackTaskEngine:
     """Lightweight task engine placeholder for CLI usage."""
@@ -20,6 +16,19 @@ class _FallbackTaskEngine:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the latest LoreKeeper weekly arc.")
+    parser.add_argument(
+        "--template", choices=["default", "compressed", "json"], default="default", help="Output template"
+    )
+    args = parser.parse_args()
+
+    # Deferred (the package __init__s are lazy too) so `--help` and argument
+    # errors return without loading the engines.
+    from ..drift_auditor import DriftAuditor
+    from ..narrative_stitcher import NarrativeStitcher
+    from ..timeline_manager import TimelineManager
+    from .arc_engine import WeeklyArcEngine
+
     base_path = Path(__file__).resolve().parent.parent / "timeline"
     timeline_manager = TimelineManager(base_path=base_path)
     stitcher = NarrativeStitcher()
@@ -28,7 +37,7 @@ def main() -> None:
 
     engine = WeeklyArcEngine(timeline_manager, stitcher, task_engine, drift_auditor)
     arc = engine.construct_week_arc()
-    rendered = engine.render_arc(arc, template="default")
+    rendered = engine.render_arc(arc, template=args.template)
     print(rendered)
 
 
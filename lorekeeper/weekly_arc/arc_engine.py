@@ -1,21 +1,141 @@
 """Weekly arc generation engine for LoreKeeper."""
 from __future__ import annotations
 
+import hashlib
 import json
-from collections import Counter, defaultdict
-from dataclasses import asdict, is_dataclass
+import logging
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, fields, is_dataclass
+from itertools import chain
+from operator import attrgetter
 from datetime import date, datetime, timedelta
-from typing import Any, List, Optional
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, List, Optional
 
+from ..drift_auditor import DriftFlag
 from ..event_schema import TimelineEvent
+from .arc_templates import STATS_TEXT_CACHE_KEY, compressed_md_template, default_md_template
+
+logger = logging.getLogger(__name__)
+
+# Exact types accepted as sentiment scores (bools are deliberately excluded).
+_NUMERIC_TYPES = frozenset({int, float})
+
+_DONE_STATUSES = frozenset({"completed", "done"})
+_OVERDUE_STATUSES = frozenset({"overdue", "late"})
+_NEW_STATUSES = frozenset({"new", "open", "created"})
+_HIGH_PRIORITIES = frozenset({"high", "urgent", "p1"})
+_SUNDAY_NAMES = frozenset({"sunday", "sun"})
+_SEVERITY_LEVELS = {"low": 1, "medium": 2, "high": 3}
+_SEVERITY_NAMES = {level: name for name, level in _SEVERITY_LEVELS.items()}
+_MAX_SEVERITY = max(_SEVERITY_LEVELS.values())
+_EVENT_DATE = attrgetter("date")
+
+# Bump when the arc layout or its derivation changes so cached arcs are rebuilt.
+_ARC_CACHE_VERSION = 1
+_DRIFT_FLAG_FIELDS = frozenset(field.name for field in fields(DriftFlag))
+
+
+def _dump_drift_flag(flag: Any) -> Any:
+    """Plain-dict form of an auditor's flag for the arc cache, whatever its type."""
+
+    if is_dataclass(flag) and not isinstance(flag, type):
+        return asdict(flag)
+    if isinstance(flag, dict):
+        return flag
+    if hasattr(flag, "__dict__"):
+        return dict(vars(flag))
+    return {"severity": getattr(flag, "severity", "low"), "notes": getattr(flag, "notes", "")}
+
+
+def _load_drift_flag(issue: Any) -> Any:
+    """Inverse of ``_dump_drift_flag``: DriftFlag-shaped dicts become DriftFlags, others keep attribute access."""
+
+    if not isinstance(issue, dict):
+        return issue
+    if issue.keys() == _DRIFT_FLAG_FIELDS:
+        return DriftFlag(**issue)
+    return SimpleNamespace(**issue)
+
+
+# Exact-type handlers for leaf values; subclasses fall back to the isinstance checks.
+_LEAF_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    date: date.isoformat,
+    datetime: datetime.isoformat,
+    TimelineEvent: asdict,
+}
+
+
+def _serialize_leaf(obj: Any) -> Any:
+    handler = _LEAF_SERIALIZERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    return obj
+
+
+def _serialize_events(obj: Any) -> Any:
+    """Convert dataclasses and dates inside nested lists/dicts into JSON-native values.
+
+    Walks containers with an explicit stack, so deeply nested arcs cost no
+    recursion; each output container is created empty and filled when popped.
+    """
+
+    if not isinstance(obj, (list, dict)):
+        return _serialize_leaf(obj)
+    root: Any = [] if isinstance(obj, list) else {}
+    stack = [(obj, root)]
+    while stack:
+        source, target = stack.pop()
+        items = enumerate(source) if isinstance(source, list) else source.items()
+        for key, value in items:
+            kind = type(value)
+            if kind is list or kind is dict or isinstance(value, (list, dict)):
+                child: Any = [] if isinstance(value, list) else {}
+                stack.append((value, child))
+            else:
+                child = _serialize_leaf(value)
+            if type(target) is list:
+                target.append(child)
+            else:
+                target[key] = child
+    return root
 
 
 class WeeklyArcEngine:
-    def __init__(self, timeline_manager, narrative_stitcher, task_engine, drift_auditor):
+    def __init__(
+        self,
+        timeline_manager,
+        narrative_stitcher,
+        task_engine,
+        drift_auditor,
+        cache_dir: Optional[Path] = None,
+        max_workers: int = 1,
+        return_task_lists: bool = True,
+    ):
         self.timeline_manager = timeline_manager
         self.narrative_stitcher = narrative_stitcher
         self.task_engine = task_engine
         self.drift_auditor = drift_auditor
+        # Closed weeks are cached here as JSON when set; None disables caching.
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        # Threads for the task, narrative and drift stages of an arc build. The
+        # default of 1 runs them serially; raise it only for I/O-bound task engines,
+        # since a pool per build costs more than in-memory stages save.
+        self.max_workers = max_workers
+        # When False, task summaries carry only counts and the efficiency score.
+        self._return_task_lists = return_task_lists
+        self._renderers: dict[str, Callable[[dict[str, Any]], str]] = {
+            "default": default_md_template,
+            "compressed": compressed_md_template,
+            "json": self._render_json,
+        }
 
     def _coerce_date(self, value: Optional[Any]) -> Optional[date]:
         if value is None:
@@ -23,6 +143,9 @@ class WeeklyArcEngine:
         if isinstance(value, date):
             return value
         if isinstance(value, str):
+            # Plain YYYY-MM-DD strings skip building a throwaway datetime.
+            if len(value) == 10:
+                return date.fromisoformat(value)
             return datetime.fromisoformat(value).date()
         raise TypeError("Date values must be ISO strings or datetime.date instances")
 
@@ -36,58 +159,61 @@ class WeeklyArcEngine:
             start = end - timedelta(days=6)
 
         if start is None or end is None:
-            today = datetime.utcnow().date()
-            week_start = getattr(self.timeline_manager, "week_start", "monday")
-            normalized_start = str(week_start).lower()
-            if normalized_start in {"sunday", "sun"}:
-                delta = (today.weekday() + 1) % 7
-            else:
-                delta = today.weekday()
-            start = today - timedelta(days=delta)
+            # Local calendar day, matching TimelineManager's rolling periods; no
+            # caller relies on UTC here and date.today() skips the datetime build.
+            start = self._week_start_for(date.today())
             end = start + timedelta(days=6)
 
         return start, end
 
-    def _serialize_events(self, obj: Any) -> Any:
-        if is_dataclass(obj):
-            return asdict(obj)
-        if isinstance(obj, TimelineEvent):
-            return obj.__dict__
-        if isinstance(obj, list):
-            return [self._serialize_events(item) for item in obj]
-        if isinstance(obj, dict):
-            return {key: self._serialize_events(value) for key, value in obj.items()}
-        if isinstance(obj, (date, datetime)):
-            return obj.isoformat()
-        return obj
+    def _week_start_for(self, day: date) -> date:
+        """First day of the week containing ``day``, honouring the manager's ``week_start``."""
+
+        week_start = getattr(self.timeline_manager, "week_start", "monday")
+        normalized_start = str(week_start).lower()
+        if normalized_start in _SUNDAY_NAMES:
+            delta = (day.weekday() + 1) % 7
+        else:
+            delta = day.weekday()
+        return day - timedelta(days=delta)
+
+    _serialize_events = staticmethod(_serialize_events)
 
     def gather_week_events(self, start_date: Optional[Any] = None, end_date: Optional[Any] = None) -> dict[str, Any]:
         start, end = self._resolve_week_range(start_date=start_date, end_date=end_date)
+        return self._gather_week_events_resolved(start, end)[0]
+
+    def _gather_week_events_resolved(self, start: date, end: date) -> tuple[dict[str, Any], Counter[str]]:
+        """Build the events payload and return the raw tag counter alongside it for theme/epic reuse."""
+
         events = self.timeline_manager.get_events(start_date=start.isoformat(), end_date=end.isoformat())
 
-        tag_counter: Counter[str] = Counter()
+        tag_counter = self._count_tags(events)
         device_counter: Counter[str] = Counter()
         sentiment_counter: Counter[str] = Counter()
         sentiment_scores: List[float] = []
 
+        # Bind the per-event callable once; this loop runs over the whole week.
+        add_score = sentiment_scores.append
         for event in events:
-            tag_counter.update(event.tags)
-            if isinstance(event.metadata, dict):
-                device = event.metadata.get("device")
-                if device:
-                    device_counter[device] += 1
-                sentiment = event.metadata.get("sentiment")
-                if sentiment:
-                    sentiment_counter[str(sentiment)] += 1
-                score = event.metadata.get("sentiment_score")
-                if isinstance(score, (int, float)):
-                    sentiment_scores.append(float(score))
+            meta = event.metadata
+            if not isinstance(meta, dict) or not meta:
+                continue
+            device = meta.get("device")
+            if device:
+                device_counter[device] += 1
+            sentiment = meta.get("sentiment")
+            if sentiment:
+                sentiment_counter[str(sentiment)] += 1
+            score = meta.get("sentiment_score")
+            if type(score) in _NUMERIC_TYPES:
+                add_score(float(score))
 
         sentiment_summary: dict[str, Any] = {"counts": dict(sentiment_counter)}
         if sentiment_scores:
             sentiment_summary["average_score"] = sum(sentiment_scores) / len(sentiment_scores)
 
-        return {
+        payload = {
             "events": events,
             "stats": {
                 "count": len(events),
@@ -97,40 +223,72 @@ class WeeklyArcEngine:
             },
             "time_window": f"{start.isoformat()} to {end.isoformat()}",
         }
+        return payload, tag_counter
 
     def summarize_week_tasks(self, start_date: Optional[Any] = None, end_date: Optional[Any] = None) -> dict[str, Any]:
         start, end = self._resolve_week_range(start_date=start_date, end_date=end_date)
+        return self._summarize_week_tasks_resolved(start, end)
 
+    def _summarize_week_tasks_resolved(self, start: date, end: date) -> dict[str, Any]:
         task_fetcher = getattr(self.task_engine, "get_tasks", None)
         if callable(task_fetcher):
             tasks = task_fetcher(start.isoformat(), end.isoformat())
         else:
             tasks = getattr(self.task_engine, "tasks", [])
 
-        def _filter_tasks(statuses: set[str]) -> List[Any]:
-            return [task for task in tasks if str(task.get("status", "")).lower() in statuses]
-
-        completed = _filter_tasks({"completed", "done"})
-        overdue = _filter_tasks({"overdue", "late"})
-        new_tasks = _filter_tasks({"new", "open", "created"})
-        priority_tasks = [task for task in tasks if str(task.get("priority", "")).lower() in {"high", "urgent", "p1"}]
-
-        completion_ratio = len(completed) / len(tasks) if tasks else 0.0
-        priority_total = len(priority_tasks)
-        priority_done = len([task for task in priority_tasks if task in completed or str(task.get("status")) == "completed"])
+        # One pass: normalise each task's status and priority once and count it;
+        # the per-bucket lists are only built when the caller wants them.
+        keep_lists = self._return_task_lists
+        completed: List[Any] = []
+        overdue: List[Any] = []
+        new_tasks: List[Any] = []
+        priority_tasks: List[Any] = []
+        completed_count = overdue_count = new_count = 0
+        priority_total = priority_done = 0
+        task_total = 0
+        for task in tasks:
+            task_total += 1
+            status = str(task.get("status", "")).lower()
+            is_done = status in _DONE_STATUSES
+            if is_done:
+                completed_count += 1
+                if keep_lists:
+                    completed.append(task)
+            elif status in _OVERDUE_STATUSES:
+                overdue_count += 1
+                if keep_lists:
+                    overdue.append(task)
+            elif status in _NEW_STATUSES:
+                new_count += 1
+                if keep_lists:
+                    new_tasks.append(task)
+            if str(task.get("priority", "")).lower() in _HIGH_PRIORITIES:
+                priority_total += 1
+                priority_done += is_done
+                if keep_lists:
+                    priority_tasks.append(task)
+
+        completion_ratio = completed_count / task_total if task_total else 0.0
         priority_fulfillment = priority_done / priority_total if priority_total else 1.0
         efficiency_score = completion_ratio * priority_fulfillment
 
-        return {
-            "completed": completed,
-            "overdue": overdue,
-            "new_tasks": new_tasks,
-            "priority": priority_tasks,
+        summary: dict[str, Any] = {
+            "counts": {
+                "completed": completed_count,
+                "overdue": overdue_count,
+                "new_tasks": new_count,
+                "priority": priority_total,
+            },
             "efficiency_score": efficiency_score,
             "time_window": f"{start.isoformat()} to {end.isoformat()}",
         }
+        if keep_lists:
+            summary.update(completed=completed, overdue=overdue, new_tasks=new_tasks, priority=priority_tasks)
+        return summary
+
+    def generate_week_narrative(self, events: List[TimelineEvent], pre_sorted: bool = False) -> dict[str, Any]:
+        """Build the hook/arc/subplots/cliffhanger; pass ``pre_sorted`` when events are already date-ordered."""
 
-    def generate_week_narrative(self, events: List[TimelineEvent]) -> dict[str, Any]:
         if not events:
             return {
                 "hook": "A quiet week with room for new beginnings.",
@@ -139,7 +297,7 @@ class WeeklyArcEngine:
                 "cliffhanger": "What spark will ignite next week?",
             }
 
-        ordered_events = sorted(events, key=lambda e: e.date)
+        ordered_events = events if pre_sorted else sorted(events, key=_EVENT_DATE)
         sections = self.narrative_stitcher.segment_events(ordered_events)
         hook_event = ordered_events[0]
         hook = f"The week opened on {hook_event.date} with {hook_event.title}."
@@ -161,17 +319,33 @@ class WeeklyArcEngine:
         self, start_date: Optional[Any] = None, end_date: Optional[Any] = None, events: Optional[List[TimelineEvent]] = None
     ) -> dict[str, Any]:
         start, end = self._resolve_week_range(start_date=start_date, end_date=end_date)
-        events_to_audit = events or self.timeline_manager.get_events(start_date=start.isoformat(), end_date=end.isoformat())
-        flags = self.drift_auditor.audit(events_to_audit)
+        return self._run_weekly_drift_audit_resolved(start, end, events)
 
-        severity_levels = {"low": 1, "medium": 2, "high": 3}
-        highest = "low"
+    def _run_weekly_drift_audit_resolved(
+        self, start: date, end: date, events: Optional[List[TimelineEvent]] = None
+    ) -> dict[str, Any]:
+        # An explicitly passed (even empty) event list is audited as-is; only a
+        # missing one triggers a fetch.
+        if events is None:
+            events = self.timeline_manager.get_events(start_date=start.isoformat(), end_date=end.isoformat())
+        flags = self.drift_auditor.audit(events)
+
+        # Track the level as an int and stop at the first "high"; nothing outranks it.
+        highest_level = 1
+        level_of = _SEVERITY_LEVELS.get
         for flag in flags:
-            flag_severity = getattr(flag, "severity", "low")
-            if severity_levels.get(flag_severity, 1) > severity_levels.get(highest, 1):
-                highest = flag_severity
-
-        notes = "; ".join(getattr(flag, "notes", "") for flag in flags) if flags else "No drift detected."
+            level = level_of(getattr(flag, "severity", "low"), 1)
+            if level > highest_level:
+                highest_level = level
+                if level == _MAX_SEVERITY:
+                    break
+        highest = _SEVERITY_NAMES[highest_level]
+
+        if flags:
+            # Flags without notes are skipped so they don't leave "; ;" gaps.
+            notes = "; ".join([note for note in (getattr(flag, "notes", "") for flag in flags) if note])
+        else:
+            notes = "No drift detected."
 
         return {
             "issues": flags,
@@ -180,38 +354,145 @@ class WeeklyArcEngine:
             "time_window": f"{start.isoformat()} to {end.isoformat()}",
         }
 
-    def _infer_themes(self, events: List[TimelineEvent]) -> List[str]:
-        tags = Counter()
-        for event in events:
-            tags.update(event.tags)
-        common = [tag for tag, _ in tags.most_common(5)]
-        return common
-
-    def _detect_epics(self, events: List[TimelineEvent]) -> List[str]:
-        tag_clusters: defaultdict[str, List[str]] = defaultdict(list)
-        for event in events:
-            for tag in event.tags:
-                tag_clusters[tag.lower()].append(event.title)
-
-        epics = []
-        for tag, titles in tag_clusters.items():
-            if len(titles) >= 2:
-                epics.append(f"{tag.title()} ({len(titles)} beats)")
-            else:
-                epics.append(f"{tag.title()} (spark)")
-        return epics
+    @staticmethod
+    def _count_tags(events: List[TimelineEvent]) -> Counter[str]:
+        # One C-level count over the flattened tag stream instead of an update per event.
+        return Counter(chain.from_iterable(event.tags for event in events))
+
+    def _infer_themes(self, events: List[TimelineEvent], tag_counter: Optional[Counter[str]] = None) -> List[str]:
+        if tag_counter is None:
+            tag_counter = self._count_tags(events)
+        return [tag for tag, _ in tag_counter.most_common(5)]
+
+    def _detect_epics(self, events: List[TimelineEvent], tag_counter: Optional[Counter[str]] = None) -> List[str]:
+        if tag_counter is None:
+            tag_counter = self._count_tags(events)
+        # Fold case over the distinct tags rather than every tag occurrence; the
+        # counter keeps first-seen order, so epics come out in the same order.
+        beats: dict[str, int] = {}
+        beats_get = beats.get
+        for tag, count in tag_counter.items():
+            folded = tag.lower()
+            beats[folded] = beats_get(folded, 0) + count
+
+        return [
+            f"{tag.title()} ({count} beats)" if count >= 2 else f"{tag.title()} (spark)"
+            for tag, count in beats.items()
+        ]
+
+    def _arc_cache_path(self, start: date, end: date) -> Path:
+        return self.cache_dir / f"{start.isoformat()}_{end.isoformat()}.json"
+
+    def _arc_fingerprint(self, events: List[TimelineEvent]) -> str:
+        """Digest of the week's event ids and archive flags plus the cache and stitcher versions."""
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{_ARC_CACHE_VERSION}|{type(self.narrative_stitcher).__qualname__}".encode("utf-8"))
+        for event_id, archived in sorted((event.id, event.archived) for event in events):
+            digest.update(f"|{event_id}:{int(archived)}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_cached_arc(self, start: date, end: date, fingerprint: str) -> Optional[dict[str, Any]]:
+        path = self._arc_cache_path(start, end)
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if cached.get("fingerprint") != fingerprint:
+            return None
+        return cached.get("arc")
+
+    def _store_cached_arc(self, start: date, end: date, fingerprint: str, arc: dict[str, Any]) -> Path:
+        path = self._arc_cache_path(start, end)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        stored_arc = self._public_arc(arc)
+        drift = stored_arc.get("drift")
+        if isinstance(drift, dict) and drift.get("issues"):
+            issues = [_dump_drift_flag(flag) for flag in drift["issues"]]
+            stored_arc = {**stored_arc, "drift": {**drift, "issues": issues}}
+        payload = {"fingerprint": fingerprint, "arc": stored_arc}
+        try:
+            text = json.dumps(payload, default=self._serialize_events, ensure_ascii=False)
+        except (TypeError, ValueError) as exc:
+            # The cache is an optimization; an arc it cannot hold is simply rebuilt next time.
+            logger.warning("Not caching arc for %s to %s: %s", start, end, exc)
+            return path
+        temp_path.write_text(text, encoding="utf-8")
+        os.replace(temp_path, path)
+        return path
+
+    def precompute_arcs(self, weeks_back: int, today: Optional[date] = None) -> List[Path]:
+        """Build and cache the arcs of the ``weeks_back`` closed weeks before the current one.
+
+        Meant for an off-peak scheduled job; later ``construct_week_arc`` calls for
+        those weeks are served from the cache while their events are unchanged.
+        """
+
+        if self.cache_dir is None:
+            raise ValueError("precompute_arcs requires a cache_dir")
+        today = today or date.today()
+        current_start = self._week_start_for(today)
+        paths = []
+        for offset in range(1, weeks_back + 1):
+            week_start = current_start - timedelta(weeks=offset)
+            week_end = week_start + timedelta(days=6)
+            self._construct_week_arc_resolved(week_start, week_end, today)
+            paths.append(self._arc_cache_path(week_start, week_end))
+        return paths
+
+    @staticmethod
+    def _restore_drift_flags(drift: dict[str, Any]) -> dict[str, Any]:
+        """Turn cached drift issues back into flag objects, as a fresh audit returns them."""
+
+        drift["issues"] = [_load_drift_flag(issue) for issue in drift.get("issues", [])]
+        return drift
 
     def construct_week_arc(self, start_date: Optional[Any] = None, end_date: Optional[Any] = None) -> dict[str, Any]:
-        events_payload = self.gather_week_events(start_date=start_date, end_date=end_date)
+        # Resolve the window once and hand the concrete dates to every stage.
         start, end = self._resolve_week_range(start_date=start_date, end_date=end_date)
-        tasks_summary = self.summarize_week_tasks(start_date=start, end_date=end)
-        narrative = self.generate_week_narrative(events_payload["events"])
-        drift = self.run_weekly_drift_audit(start_date=start, end_date=end, events=events_payload["events"])
-
-        themes = self._infer_themes(events_payload["events"])
-        epics = self._detect_epics(events_payload["events"])
-
-        return {
+        return self._construct_week_arc_resolved(start, end, date.today())
+
+    def _construct_week_arc_resolved(self, start: date, end: date, today: date) -> dict[str, Any]:
+        events_payload, tag_counter = self._gather_week_events_resolved(start, end)
+        # Sort once here for every stage and for cache hits alike; timeline managers
+        # are duck-typed and need not return date order (for TimelineManager, which
+        # does, this is a linear pass).
+        events = events_payload["events"] = sorted(events_payload["events"], key=_EVENT_DATE)
+
+        # Closed weeks only change when their events do, so a fingerprint match
+        # lets the narrative and drift stages be skipped. Tasks live outside the
+        # timeline and can still change state, so they are always summarized fresh.
+        fingerprint = None
+        if self.cache_dir is not None and end < today:
+            fingerprint = self._arc_fingerprint(events)
+            cached = self._load_cached_arc(start, end, fingerprint)
+            if cached is not None:
+                cached["events"] = events_payload
+                cached["tasks"] = self._summarize_week_tasks_resolved(start, end)
+                self._restore_drift_flags(cached.setdefault("drift", {}))
+                return cached
+
+        # The task, narrative and drift stages only share the fetched events, so
+        # with max_workers > 1 a slow task backend overlaps the other two.
+        if self.max_workers <= 1:
+            tasks_summary = self._summarize_week_tasks_resolved(start, end)
+            narrative = self.generate_week_narrative(events, pre_sorted=True)
+            drift = self._run_weekly_drift_audit_resolved(start, end, events)
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, 3)) as executor:
+                tasks_future = executor.submit(self._summarize_week_tasks_resolved, start, end)
+                narrative_future = executor.submit(self.generate_week_narrative, events, pre_sorted=True)
+                drift_future = executor.submit(self._run_weekly_drift_audit_resolved, start, end, events)
+                tasks_summary = tasks_future.result()
+                narrative = narrative_future.result()
+                drift = drift_future.result()
+
+        # gather already counted every tag; themes and epics reuse that tally.
+        themes = self._infer_themes(events, tag_counter)
+        epics = self._detect_epics(events, tag_counter)
+
+        arc = {
             "time_window": f"{start.isoformat()} to {end.isoformat()}",
             "events": events_payload,
             "tasks": tasks_summary,
@@ -220,15 +501,35 @@ class WeeklyArcEngine:
             "themes": themes,
             "epics": epics,
         }
+        if fingerprint is not None:
+            self._store_cached_arc(start, end, fingerprint, arc)
+        return arc
+
+    @staticmethod
+    def _public_arc(arc: dict[str, Any]) -> dict[str, Any]:
+        """Drop render memos so they never reach JSON output or the arc cache."""
+
+        if STATS_TEXT_CACHE_KEY not in arc:
+            return arc
+        return {key: value for key, value in arc.items() if key != STATS_TEXT_CACHE_KEY}
+
+    def _render_json(self, arc: dict[str, Any]) -> str:
+        return json.dumps(self._public_arc(arc), default=self._serialize_events, indent=2, ensure_ascii=False)
 
     def render_arc(self, arc: dict[str, Any], template: str = "default") -> str:
-        from .arc_templates import compressed_md_template, default_md_template
+        renderer = self._renderers.get(template)
+        if renderer is None:
+            raise ValueError(f"Unsupported template: {template}")
+        return renderer(arc)
+
+    def render_arcs(self, arcs: List[dict[str, Any]], template: str = "default") -> List[str]:
+        """Render a batch of arcs, resolving the template and JSON encoder once for all of them."""
 
-        if template == "default":
-            return default_md_template(arc)
-        if template == "compressed":
-            return compressed_md_template(arc)
+        renderer = self._renderers.get(template)
+        if renderer is None:
+            raise ValueError(f"Unsupported template: {template}")
         if template == "json":
-            serializable = json.loads(json.dumps(arc, default=self._serialize_events))
-            return json.dumps(serializable, indent=2, ensure_ascii=False)
-        raise ValueError(f"Unsupported template: {template}")
+            encode = json.JSONEncoder(default=self._serialize_events, indent=2, ensure_ascii=False).encode
+            public_arc = self._public_arc
+            return [encode(public_arc(arc)) for arc in arcs]
+        return [renderer(arc) for arc in arcs]
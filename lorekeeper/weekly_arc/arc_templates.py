@@ -2,9 +2,65 @@
 from __future__ import annotations
 
 import json
+from string import Template
 from textwrap import dedent
 from typing import Any
 
+# Dedented once at import; substituted values are inserted after dedenting, so
+# multi-line blocks (stats JSON, bullet lists) no longer defeat the dedent.
+_DEFAULT_TEMPLATE = Template(
+    dedent(
+        """
+        # 🟣 Weekly Arc — $time_window
+
+        ## 🔥 Opening Hook
+        $hook
+
+        ## 📘 Main Arc
+        $arc
+
+        ## 🧩 Subplots
+        $subplots
+
+        ## 🧨 Cliffhanger for Next Week
+        $cliffhanger
+
+        ## 📅 Events Summary
+        $stats
+
+        ## 📌 Tasks Summary
+        - Completed: $completed
+        - Overdue: $overdue
+        - Priority Focus: $priority
+        - Efficiency Score: $efficiency_score
+
+        ## ⚠️ Drift Auditor
+        $drift_notes
+
+        ## 🎭 Themes of the Week
+        $themes
+
+        ## 🧵 Epics In Motion
+        $epics
+        """
+    )
+)
+
+
+# Arc key under which the rendered stats block is memoized between renders.
+STATS_TEXT_CACHE_KEY = "_stats_text_cache"
+
+
+def _stats_text(arc: dict[str, Any], stats: dict[str, Any]) -> str:
+    # The memo remembers which stats dict it was dumped from, so a swapped-in
+    # payload (e.g. fresh events on a cached arc) is re-serialized.
+    cached = arc.get(STATS_TEXT_CACHE_KEY)
+    if cached is not None and cached[0] is stats:
+        return cached[1]
+    text = json.dumps(stats, indent=2)
+    arc[STATS_TEXT_CACHE_KEY] = (stats, text)
+    return text
+
 
 def _list_block(items: list[str]) -> str:
     if not items:
@@ -12,6 +68,13 @@ def _list_block(items: list[str]) -> str:
     return "\n".join(f"- {item}" for item in items)
 
 
+def _task_field(tasks: dict[str, Any], key: str) -> Any:
+    # Count-only summaries omit the task lists; show their counts instead.
+    if key in tasks:
+        return tasks[key]
+    return tasks.get("counts", {}).get(key, [])
+
+
 def default_md_template(arc: dict[str, Any]) -> str:
     narrative = arc.get("narrative", {})
     events = arc.get("events", {})
@@ -20,42 +83,21 @@ def default_md_template(arc: dict[str, Any]) -> str:
     themes = arc.get("themes", [])
     epics = arc.get("epics", [])
 
-    stats_text = json.dumps(events.get("stats", {}), indent=2)
-
-    template = f"""
-    # 🟣 Weekly Arc — {arc.get('time_window', '')}
-
-    ## 🔥 Opening Hook
-    {narrative.get('hook', '')}
-
-    ## 📘 Main Arc
-    {narrative.get('arc', '')}
-
-    ## 🧩 Subplots
-    {_list_block(narrative.get('subplots', []))}
-
-    ## 🧨 Cliffhanger for Next Week
-    {narrative.get('cliffhanger', '')}
-
-    ## 📅 Events Summary
-    {stats_text}
-
-    ## 📌 Tasks Summary
-    - Completed: {tasks.get('completed', [])}
-    - Overdue: {tasks.get('overdue', [])}
-    - Priority Focus: {tasks.get('priority', [])}
-    - Efficiency Score: {tasks.get('efficiency_score', 0.0)}
-
-    ## ⚠️ Drift Auditor
-    {drift.get('notes', '')}
-
-    ## 🎭 Themes of the Week
-    {_list_block(themes)}
-
-    ## 🧵 Epics In Motion
-    {_list_block(epics)}
-    """
-    return dedent(template).strip() + "\n"
+    return _DEFAULT_TEMPLATE.substitute(
+        time_window=arc.get("time_window", ""),
+        hook=narrative.get("hook", ""),
+        arc=narrative.get("arc", ""),
+        subplots=_list_block(narrative.get("subplots", [])),
+        cliffhanger=narrative.get("cliffhanger", ""),
+        stats=_stats_text(arc, events.get("stats", {})),
+        completed=_task_field(tasks, "completed"),
+        overdue=_task_field(tasks, "overdue"),
+        priority=_task_field(tasks, "priority"),
+        efficiency_score=tasks.get("efficiency_score", 0.0),
+        drift_notes=drift.get("notes", ""),
+        themes=_list_block(themes),
+        epics=_list_block(epics),
+    ).strip() + "\n"
 
 
 def compressed_md_template(arc: dict[str, Any]) -> str:
@@ -1,12 +1,15 @@
 """Tests for the WeeklyArcEngine."""
 from __future__ import annotations
 
+import json
 import unittest
+from unittest import mock
 from datetime import date
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from types import SimpleNamespace
 
-from ..drift_auditor import DriftAuditor
+from ..drift_auditor import DriftAuditor, DriftFlag
 from ..event_schema import TimelineEvent
 from ..narrative_stitcher import NarrativeStitcher
 from ..timeline_manager import TimelineManager
@@ -65,6 +68,23 @@ class WeeklyArcEngineTests(unittest.TestCase):
         self.assertEqual(len(summary["completed"]), 1)
         self.assertEqual(len(summary["overdue"]), 1)
         self.assertGreater(summary["efficiency_score"], 0)
+        self.assertEqual(len(summary["new_tasks"]), 1)
+        self.assertAlmostEqual(summary["efficiency_score"], (1 / 3) * (1 / 2))
+
+    def test_summarize_week_tasks_counts_only(self) -> None:
+        self.task_engine.tasks = [
+            {"title": "Ship", "status": "completed", "priority": "high"},
+            {"title": "File", "status": "overdue", "priority": "high"},
+            {"title": "Plan", "status": "new", "priority": "low"},
+        ]
+        engine = WeeklyArcEngine(self.manager, self.stitcher, self.task_engine, self.drift, return_task_lists=False)
+        summary = engine.summarize_week_tasks(start_date=date(2024, 6, 3))
+        self.assertNotIn("completed", summary)
+        self.assertEqual(summary["counts"], {"completed": 1, "overdue": 1, "new_tasks": 1, "priority": 2})
+        self.assertAlmostEqual(summary["efficiency_score"], (1 / 3) * (1 / 2))
+
+        md = engine.render_arc(engine.construct_week_arc(start_date="2024-06-03"), template="default")
+        self.assertIn("- Completed: 1\n- Overdue: 1\n- Priority Focus: 2\n", md)
 
     def test_generate_week_narrative(self) -> None:
         events = [
@@ -85,6 +105,18 @@ class WeeklyArcEngineTests(unittest.TestCase):
         self.assertEqual(audit["severity"], "high")
         self.assertTrue(audit["issues"])
 
+    def test_drift_notes_skip_empty_entries(self) -> None:
+        flags = [
+            SimpleNamespace(severity="medium", notes="Conflicting outcomes"),
+            SimpleNamespace(severity="low", notes=""),
+            SimpleNamespace(severity="low"),
+            SimpleNamespace(severity="high", notes="Duplicate milestone"),
+        ]
+        with mock.patch.object(self.drift, "audit", return_value=flags):
+            audit = self.engine.run_weekly_drift_audit(start_date="2024-06-03", events=[])
+        self.assertEqual(audit["notes"], "Conflicting outcomes; Duplicate milestone")
+        self.assertEqual(audit["severity"], "high")
+
     def test_construct_week_arc(self) -> None:
         self._add_event(date="2024-06-03", title="Build", type="project", details="Robot", tags=["robotics"])
         self._add_event(date="2024-06-04", title="Train", type="training", details="BJJ", tags=["bjj"])
@@ -94,12 +126,135 @@ class WeeklyArcEngineTests(unittest.TestCase):
         self.assertTrue(arc["themes"])
         self.assertTrue(arc["epics"])
 
+    def test_construct_week_arc_serial_matches_threaded(self) -> None:
+        self._add_event(date="2024-06-03", title="Build", type="project", details="Robot", tags=["robotics"])
+        self._add_event(date="2024-06-04", title="Train", type="training", details="BJJ", tags=["bjj"])
+        self.task_engine.tasks = [{"title": "Ship", "status": "completed", "priority": "high"}]
+        threaded = WeeklyArcEngine(self.manager, self.stitcher, self.task_engine, self.drift, max_workers=3)
+        serial = self.engine.construct_week_arc(start_date="2024-06-03")
+        self.assertEqual(threaded.construct_week_arc(start_date="2024-06-03"), serial)
+
+    def test_construct_week_arc_orders_unsorted_manager_events(self) -> None:
+        build = self._add_event(date="2024-06-03", title="Build", type="project", details="Robot", tags=["robotics"])
+        train = self._add_event(date="2024-06-05", title="Train", type="training", details="BJJ", tags=["bjj"])
+        with mock.patch.object(self.manager, "get_events", return_value=[train, build]):
+            arc = self.engine.construct_week_arc(start_date="2024-06-03")
+        self.assertEqual([event.title for event in arc["events"]["events"]], ["Build", "Train"])
+        self.assertIn("Build", arc["narrative"]["hook"])
+
     def test_render_arc_markdown(self) -> None:
         self._add_event(date="2024-06-03", title="Build", type="project", details="Robot", tags=["robotics"])
         arc = self.engine.construct_week_arc(start_date="2024-06-03", end_date="2024-06-09")
         md = self.engine.render_arc(arc, template="default")
         self.assertIn("Weekly Arc", md)
         self.assertIn("📌 Tasks Summary", md)
+        self.assertIn("\n## 📌 Tasks Summary\n", md)
+
+    def test_default_render_reuses_stats_text(self) -> None:
+        self._add_event(date="2024-06-03", title="Build", type="project", details="Robot", tags=["robotics"])
+        arc = self.engine.construct_week_arc(start_date="2024-06-03", end_date="2024-06-09")
+        first = self.engine.render_arc(arc, template="default")
+        with mock.patch("lorekeeper.weekly_arc.arc_templates.json.dumps") as dumps:
+            second = self.engine.render_arc(arc, template="default")
+        dumps.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertNotIn("_stats_text_cache", json.loads(self.engine.render_arc(arc, template="json")))
+
+    def test_render_arc_json_and_unknown_template(self) -> None:
+        self._add_event(date="2024-06-03", title="Build", type="project", details="Robot", tags=["robotics"])
+        arc = self.engine.construct_week_arc(start_date="2024-06-03", end_date="2024-06-09")
+        rendered = json.loads(self.engine.render_arc(arc, template="json"))
+        self.assertEqual(rendered["events"]["events"][0]["title"], "Build")
+        with self.assertRaises(ValueError):
+            self.engine.render_arc(arc, template="missing")
+
+    def test_render_arcs_matches_single_renders(self) -> None:
+        self._add_event(date="2024-06-03", title="Build", type="project", details="Robot", tags=["robotics"])
+        self._add_event(date="2024-06-11", title="Train", type="training", details="BJJ", tags=["bjj"])
+        arcs = [
+            self.engine.construct_week_arc(start_date="2024-06-03"),
+            self.engine.construct_week_arc(start_date="2024-06-10"),
+        ]
+        for template in ("default", "compressed", "json"):
+            self.assertEqual(
+                self.engine.render_arcs(arcs, template=template),
+                [self.engine.render_arc(arc, template=template) for arc in arcs],
+            )
+        with self.assertRaises(ValueError):
+            self.engine.render_arcs(arcs, template="missing")
+
+    def test_precomputed_arcs_are_reused_until_events_change(self) -> None:
+        cache_dir = Path(self.temp_dir.name) / "arcs_cache"
+        engine = WeeklyArcEngine(self.manager, self.stitcher, self.task_engine, self.drift, cache_dir=cache_dir)
+        self._add_event(date="2024-06-03", title="Build", type="project", details="Robot", tags=["robotics"])
+
+        paths = engine.precompute_arcs(weeks_back=2, today=date(2024, 6, 12))
+        self.assertEqual([path.name for path in paths], ["2024-06-03_2024-06-09.json", "2024-05-27_2024-06-02.json"])
+        self.assertTrue(all(path.exists() for path in paths))
+
+        with mock.patch.object(engine, "generate_week_narrative") as narrative:
+            arc = engine.construct_week_arc(start_date="2024-06-03")
+        narrative.assert_not_called()
+        self.assertIn("Build", arc["narrative"]["hook"])
+        self.assertEqual(arc["events"]["events"][0].title, "Build")
+
+        self._add_event(date="2024-06-05", title="Train", type="training", details="BJJ", tags=["bjj"])
+        arc = engine.construct_week_arc(start_date="2024-06-03")
+        self.assertEqual(arc["events"]["stats"]["count"], 2)
+        self.assertIn("Bjj (spark)", arc["epics"])
+
+    def test_cached_arcs_refresh_tasks_and_keep_drift_flags(self) -> None:
+        cache_dir = Path(self.temp_dir.name) / "arcs_cache"
+        engine = WeeklyArcEngine(self.manager, self.stitcher, self.task_engine, self.drift, cache_dir=cache_dir)
+        self._add_event(date="2024-06-03", title="Comp", type="milestone", details="Win")
+        self._add_event(date="2024-06-03", title="Comp", type="milestone", details="Loss")
+        self.task_engine.tasks = [{"title": "Ship", "status": "open", "priority": "high"}]
+        engine.precompute_arcs(weeks_back=1, today=date(2024, 6, 12))
+
+        self.task_engine.tasks = [{"title": "Ship", "status": "completed", "priority": "high"}]
+        with mock.patch.object(engine, "generate_week_narrative") as narrative:
+            arc = engine.construct_week_arc(start_date="2024-06-03")
+        narrative.assert_not_called()
+        self.assertEqual(arc["tasks"]["counts"]["completed"], 1)
+        self.assertEqual(arc["tasks"]["efficiency_score"], 1.0)
+        self.assertTrue(all(isinstance(flag, DriftFlag) for flag in arc["drift"]["issues"]))
+        self.assertEqual(arc["drift"]["issues"], self.engine.construct_week_arc(start_date="2024-06-03")["drift"]["issues"])
+
+    def test_cache_hit_matches_the_first_build(self) -> None:
+        cache_dir = Path(self.temp_dir.name) / "arcs_cache"
+        engine = WeeklyArcEngine(self.manager, self.stitcher, self.task_engine, self.drift, cache_dir=cache_dir)
+        build = self._add_event(date="2024-06-03", title="Build", type="project", details="Robot", tags=["robotics"])
+        train = self._add_event(date="2024-06-05", title="Train", type="training", details="BJJ", tags=["bjj"])
+        flags = [
+            DriftFlag(event_ids=[build.id], issue="Gap", severity="low", notes="quiet midweek"),
+            SimpleNamespace(severity="medium", notes="custom auditor flag"),
+        ]
+        with mock.patch.object(self.manager, "get_events", return_value=[train, build]), mock.patch.object(
+            self.drift, "audit", return_value=flags
+        ):
+            first = engine.construct_week_arc(start_date="2024-06-03")
+            with mock.patch.object(engine, "generate_week_narrative") as narrative:
+                second = engine.construct_week_arc(start_date="2024-06-03")
+        narrative.assert_not_called()
+        self.assertEqual([event.title for event in second["events"]["events"]], ["Build", "Train"])
+        self.assertEqual(second, first)
+        self.assertIsInstance(second["drift"]["issues"][0], DriftFlag)
+        self.assertEqual(second["drift"]["issues"][1].notes, "custom auditor flag")
+
+    def test_precompute_uses_the_given_today_for_closed_weeks(self) -> None:
+        cache_dir = Path(self.temp_dir.name) / "arcs_cache"
+        engine = WeeklyArcEngine(self.manager, self.stitcher, self.task_engine, self.drift, cache_dir=cache_dir)
+        # Weeks before a future "today" are closed for the job even though the
+        # wall clock has not reached them yet.
+        paths = engine.precompute_arcs(weeks_back=1, today=date(2099, 6, 12))
+        self.assertEqual(paths[0].name, "2099-06-01_2099-06-07.json")
+        self.assertTrue(paths[0].exists())
+
+    def test_construct_week_arc_fetches_events_once(self) -> None:
+        with mock.patch.object(self.manager, "get_events", wraps=self.manager.get_events) as get_events:
+            arc = self.engine.construct_week_arc(start_date="2024-06-03", end_date="2024-06-09")
+        self.assertEqual(get_events.call_count, 1)
+        self.assertEqual(arc["drift"]["notes"], "No drift detected.")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
 """Lightweight benchmarking harness for LoreKeeper DSAs."""
 from __future__ import annotations
 
+import statistics
 import time
 from datetime import date, timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import List
+from typing import Callable, List
 
 from lorekeeper.event_schema import TimelineEvent
 from lorekeeper.timeline_manager import TimelineManager
@@ -68,16 +69,31 @@ def bench_priority_pipeline(events: List[TimelineEvent]) -> float:
         return time.perf_counter() - start
 
 
+def _repeat(fn: Callable[[List[TimelineEvent]], float], events: List[TimelineEvent], runs: int = 7) -> List[float]:
+    """Time ``fn`` ``runs`` times and drop the first (cold caches, allocator warmup)."""
+
+    timings = [fn(events) for _ in range(runs)]
+    return sorted(timings[1:])
+
+
+def _p95(timings: List[float]) -> float:
+    return timings[min(len(timings) - 1, round(0.95 * (len(timings) - 1)))]
+
+
 def main() -> None:
     events = _generate_events(500)
-    results = {
-        "range_queries": bench_range_queries(events),
-        "skiplist_recency": bench_skiplist(events),
-        "tag_lookups": bench_tag_lookup(events),
-        "timeline_range": bench_priority_pipeline(events),
+    benches = {
+        "range_queries": bench_range_queries,
+        "skiplist_recency": bench_skiplist,
+        "tag_lookups": bench_tag_lookup,
+        "timeline_range": bench_priority_pipeline,
     }
-    for name, duration in results.items():
-        print(f"{name}: {duration * 1000:.3f}ms")
+    for name, bench in benches.items():
+        timings = _repeat(bench, events)
+        print(
+            f"{name}: min={timings[0] * 1000:.3f}ms "
+            f"median={statistics.median(timings) * 1000:.3f}ms p95={_p95(timings) * 1000:.3f}ms"
+        )
 
 
 if __name__ == "__main__":